@@ -1,8 +1,6 @@
 """Main application entry point."""
 import sys
-from pathlib import Path
 
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
 from src.models.db import get_connection
@@ -10,6 +8,7 @@ from src.models.repository import Repository
 from src.services.settings_service import SettingsStore, ensure_app_dirs
 from src.services.state_service import StateService
 from src.services.timer_service import TimerService
+from src.ui.icons import app_icon
 from src.viewmodels import (
     DashboardViewModel,
     InvoicesViewModel,
@@ -36,19 +35,9 @@ def main() -> int:
     app.setOrganizationName("Solia")
 
     # Set application icon
-    try:
-        base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))
-        candidates = [
-            base / "ui" / "resources" / "App.ico",
-            base / "ui" / "resources" / "app.ico",
-            base / "ui" / "resources" / "App.png",
-        ]
-        for icon_path in candidates:
-            if icon_path.exists():
-                app.setWindowIcon(QIcon(str(icon_path)))
-                break
-    except Exception:
-        pass
+    icon = app_icon()
+    if not icon.isNull():
+        app.setWindowIcon(icon)
 
     # Initialize services layer (bottom of dependency chain)
     conn = get_connection()
@@ -118,7 +118,87 @@ class Repository:
         project_id: Optional[int] = None,
         start_ts: Optional[int] = None,
         end_ts: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> list[sqlite3.Row]:
+        """List time entries, newest first.
+        
+        Args:
+            profile_id: Optional profile filter
+            project_id: Optional project filter
+            start_ts: Optional lower bound on entry start
+            end_ts: Optional upper bound on entry start
+            limit: Maximum number of rows to return (None for all)
+            offset: Number of rows to skip (used with limit for paging)
+            
+        Returns:
+            List of entry rows with profile and project names
+        """
+        where, params = self._entry_filters(profile_id, project_id, start_ts, end_ts)
+        page = ""
+        if limit is not None:
+            page = " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        sql = (
+            "SELECT e.*, p.name as profile_name, p.color as profile_color, proj.name as project_name "
+            "FROM time_entries e "
+            "JOIN profiles p ON p.id = e.profile_id "
+            "LEFT JOIN projects proj ON proj.id = e.project_id "
+            f"{where} ORDER BY e.start_ts DESC, e.id DESC{page}"
+        )
+        return self.conn.execute(sql, params).fetchall()
+
+    def count_entries(
+        self,
+        profile_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> int:
+        """Count time entries matching the same filters as list_entries."""
+        where, params = self._entry_filters(profile_id, project_id, start_ts, end_ts)
+        sql = f"SELECT COUNT(*) FROM time_entries e {where}"
+        return int(self.conn.execute(sql, params).fetchone()[0])
+
+    def sum_elapsed_between(
+        self,
+        profile_id: int,
+        start_ts: int,
+        end_ts: int,
+        project_id: Optional[int] = None,
+    ) -> int:
+        """Sum tracked seconds of a profile within a time window.
+        
+        Entries are clipped to [start_ts, end_ts]; a running entry counts up
+        to end_ts.
+        
+        Args:
+            profile_id: Profile ID
+            start_ts: Window start
+            end_ts: Window end (usually now)
+            project_id: Optional project filter
+            
+        Returns:
+            Total seconds inside the window
+        """
+        sql = (
+            "SELECT COALESCE(SUM(MIN(COALESCE(end_ts, ?), ?) - MAX(start_ts, ?)), 0) "
+            "FROM time_entries "
+            "WHERE profile_id = ? AND start_ts < ? AND COALESCE(end_ts, ?) > MAX(start_ts, ?)"
+        )
+        params: list[object] = [end_ts, end_ts, start_ts, profile_id, end_ts, end_ts, start_ts]
+        if project_id is not None:
+            sql += " AND project_id = ?"
+            params.append(project_id)
+        return int(self.conn.execute(sql, params).fetchone()[0])
+
+    @staticmethod
+    def _entry_filters(
+        profile_id: Optional[int],
+        project_id: Optional[int],
+        start_ts: Optional[int],
+        end_ts: Optional[int],
+    ) -> tuple[str, list[object]]:
         clauses: list[str] = []
         params: list[object] = []
         if profile_id is not None:
@@ -134,14 +214,7 @@ class Repository:
             clauses.append("e.start_ts <= ?")
             params.append(end_ts)
         where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
-        sql = (
-            "SELECT e.*, p.name as profile_name, p.color as profile_color, proj.name as project_name "
-            "FROM time_entries e "
-            "JOIN profiles p ON p.id = e.profile_id "
-            "LEFT JOIN projects proj ON proj.id = e.project_id "
-            f"{where} ORDER BY e.start_ts DESC"
-        )
-        return self.conn.execute(sql, params).fetchall()
+        return where, params
 
     def update_entry_note_tags(self, entry_id: int, note: str, tags_csv: str) -> None:
         with self.conn:
@@ -213,16 +286,34 @@ class Repository:
             )
             return cur.lastrowid
 
-    def delete_profile_todo(self, todo_id: int) -> None:
+    def copy_profile_todos(self, source_id: int, target_id: int) -> None:
+        """Copy all todos of one profile to another, keeping order and completion."""
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO profile_todos(profile_id, text, completed)
+                SELECT ?, text, completed FROM profile_todos
+                WHERE profile_id = ?
+                ORDER BY created_ts ASC, id ASC
+                """,
+                (target_id, source_id),
+            )
+
+    def delete_profile_todo(self, todo_id: int) -> bool:
+        """Delete a profile todo; returns whether a row was deleted."""
         with self.conn:
-            self.conn.execute("DELETE FROM profile_todos WHERE id = ?", (todo_id,))
+            cur = self.conn.execute("DELETE FROM profile_todos WHERE id = ?", (todo_id,))
+            return cur.rowcount > 0
 
-    def set_profile_todo_completed(self, todo_id: int, completed: bool) -> None:
+    def set_profile_todo_completed(self, todo_id: int, completed: bool) -> bool:
+        """Set completion of a profile todo; returns whether the todo changed."""
+        value = 1 if completed else 0
         with self.conn:
-            self.conn.execute(
-                "UPDATE profile_todos SET completed = ? WHERE id = ?",
-                (1 if completed else 0, todo_id),
+            cur = self.conn.execute(
+                "UPDATE profile_todos SET completed = ? WHERE id = ? AND completed != ?",
+                (value, todo_id, value),
             )
+            return cur.rowcount > 0
 
 
     # Services
@@ -488,27 +579,36 @@ class Repository:
             )
             return cur.lastrowid
 
-    def set_project_todo_completed(self, todo_id: int, completed: bool) -> None:
+    def set_project_todo_completed(self, todo_id: int, completed: bool) -> bool:
         """Set completion status of a project todo.
         
         Args:
             todo_id: Todo ID
             completed: Completion status
+            
+        Returns:
+            True if the todo changed, False if it was missing or already in that state
         """
+        value = 1 if completed else 0
         with self.conn:
-            self.conn.execute(
-                "UPDATE project_todos SET completed = ? WHERE id = ?",
-                (1 if completed else 0, todo_id),
+            cur = self.conn.execute(
+                "UPDATE project_todos SET completed = ? WHERE id = ? AND completed != ?",
+                (value, todo_id, value),
             )
+            return cur.rowcount > 0
 
-    def delete_project_todo(self, todo_id: int) -> None:
+    def delete_project_todo(self, todo_id: int) -> bool:
         """Delete a project todo.
         
         Args:
             todo_id: Todo ID
+            
+        Returns:
+            True if a todo was deleted
         """
         with self.conn:
-            self.conn.execute("DELETE FROM project_todos WHERE id = ?", (todo_id,))
+            cur = self.conn.execute("DELETE FROM project_todos WHERE id = ?", (todo_id,))
+            return cur.rowcount > 0
 
     # Weekly aggregations
     def get_weekly_summary(self) -> list[sqlite3.Row]:
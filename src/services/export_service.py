@@ -28,22 +28,11 @@ def export_csv(repo: Repository, path: Path, profile_id: Optional[int] = None, p
         for r in rows:
             start = int(r["start_ts"]) if r["start_ts"] is not None else None
             end = int(r["end_ts"]) if r["end_ts"] is not None else None
-            duration = (end or now) - (start or now) if start else 0
+            duration = _duration(start, end, now)
             
             # Format timestamps and duration per requirements
-            if start is not None:
-                start_date = time.strftime("%d.%m.%y", time.localtime(start))
-                start_time = time.strftime("%H:%M", time.localtime(start))
-                start_str = f"[{start_date}] - {start_time}"
-            else:
-                start_str = ""
-            
-            if end is not None:
-                end_date = time.strftime("%d.%m.%y", time.localtime(end))
-                end_time = time.strftime("%H:%M", time.localtime(end))
-                end_str = f"[{end_date}] - {end_time}"
-            else:
-                end_str = ""
+            start_str = _format_csv_ts(start) if start is not None else ""
+            end_str = _format_csv_ts(end) if end is not None else ""
             
             h = max(0, int(duration)) // 3600
             m = (max(0, int(duration)) % 3600) // 60
@@ -76,12 +65,12 @@ def export_json(repo: Repository, path: Path, profile_id: Optional[int] = None,
     for r in rows:
         start = int(r["start_ts"]) if r["start_ts"] is not None else None
         end = int(r["end_ts"]) if r["end_ts"] is not None else None
-        duration = (end or now) - (start or now) if start else 0
+        duration = _duration(start, end, now)
         payload.append({
             "id": int(r["id"]),
             "profile_id": int(r["profile_id"]),
             "profile": r["profile_name"],
-            "project_id": int(r["project_id"]) if r.get("project_id") is not None else None,
+            "project_id": int(r["project_id"]) if r["project_id"] is not None else None,
             "project": r["project_name"] or None,
             "start_ts": start,
             "end_ts": end,
@@ -91,3 +80,14 @@ def export_json(repo: Repository, path: Path, profile_id: Optional[int] = None,
         })
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
+
+def _duration(start: Optional[int], end: Optional[int], now: int) -> int:
+    """Get an entry's duration; running entries count up to now."""
+    if start is None:
+        return 0
+    return (end if end is not None else now) - start
+
+
+def _format_csv_ts(ts: int) -> str:
+    """Format a timestamp as "[dd.mm.yy] - HH:MM" with a single localtime call."""
+    return time.strftime("[%d.%m.%y] - %H:%M", time.localtime(ts))
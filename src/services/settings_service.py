@@ -1,8 +1,10 @@
 """Application settings management."""
 from __future__ import annotations
 
+import base64
+import hashlib
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -28,15 +30,69 @@ def ensure_app_dirs() -> None:
     data.mkdir(parents=True, exist_ok=True)
 
 
+SETTINGS_VERSION = 2
+
+
+def _encode_blob(blob: bytes | None) -> str | None:
+    """Encode a binary Qt blob as a base64 string.
+    
+    Args:
+        blob: Raw bytes or None
+        
+    Returns:
+        Base64 string or None
+    """
+    if not isinstance(blob, (bytes, bytearray)):
+        return None
+    return base64.b64encode(blob).decode("ascii")
+
+
+def _decode_blob(text: Any, legacy: bool = False) -> bytes | None:
+    """Decode a binary Qt blob stored in the settings file.
+    
+    Args:
+        text: Encoded string (base64, or hex for legacy files)
+        legacy: Whether the value uses the old hex encoding
+        
+    Returns:
+        Decoded bytes or None if missing/invalid
+    """
+    if not isinstance(text, str):
+        return None
+    try:
+        return bytes.fromhex(text) if legacy else base64.b64decode(text, validate=True)
+    except ValueError:
+        return None
+
+
 @dataclass
 class AppSettings:
     """Application settings data class."""
     
     last_profile_id: int | None = None
-    geometry: bytes | None = None  # Qt saves as bytes; serialize as hex
+    geometry: bytes | None = None  # Qt saves as bytes; serialize as base64
     window_state: bytes | None = None
     timer_last_profile_id: int | None = None  # Last selected profile in timer view (None = "All profiles")
     timer_last_project_id: int | None = None  # Last selected project in timer view (None = "All projects")
+    # Cached output of serialize(); cleared whenever a setting changes
+    _serialized: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_"):
+            object.__setattr__(self, "_serialized", None)
+        object.__setattr__(self, name, value)
+
+    def serialize(self) -> bytes:
+        """Serialize settings to compact JSON bytes.
+        
+        The result is cached until one of the settings is assigned again.
+        
+        Returns:
+            UTF-8 encoded JSON
+        """
+        if self._serialized is None:
+            self._serialized = json.dumps(self.to_json(), separators=(",", ":")).encode("utf-8")
+        return self._serialized
 
     def to_json(self) -> dict[str, Any]:
         """Convert settings to JSON-serializable dict.
@@ -45,9 +101,10 @@ class AppSettings:
             Dictionary representation
         """
         return {
+            "version": SETTINGS_VERSION,
             "last_profile_id": self.last_profile_id,
-            "geometry": self.geometry.hex() if isinstance(self.geometry, (bytes, bytearray)) else None,
-            "window_state": self.window_state.hex() if isinstance(self.window_state, (bytes, bytearray)) else None,
+            "geometry": _encode_blob(self.geometry),
+            "window_state": _encode_blob(self.window_state),
             "timer_last_profile_id": self.timer_last_profile_id,
             "timer_last_project_id": self.timer_last_project_id,
         }
@@ -65,11 +122,13 @@ class AppSettings:
         if not obj:
             return AppSettings()
         s = AppSettings()
+        # Version 1 files stored the Qt blobs as hex, later versions use base64;
+        # files without a valid version number are read as version 1
+        version = obj.get("version")
+        legacy = not (isinstance(version, int) and version >= 2)
         s.last_profile_id = obj.get("last_profile_id")
-        geom = obj.get("geometry")
-        state = obj.get("window_state")
-        s.geometry = bytes.fromhex(geom) if isinstance(geom, str) else None
-        s.window_state = bytes.fromhex(state) if isinstance(state, str) else None
+        s.geometry = _decode_blob(obj.get("geometry"), legacy)
+        s.window_state = _decode_blob(obj.get("window_state"), legacy)
         s.timer_last_profile_id = obj.get("timer_last_profile_id")
         s.timer_last_project_id = obj.get("timer_last_project_id")
         return s
@@ -84,6 +143,9 @@ class SettingsStore:
     def __init__(self) -> None:
         """Initialize settings store."""
         self.path = get_data_dir() / SETTINGS_FILE
+        # Digest and mtime of the file as last read/written, used to skip no-op saves
+        self._last_hash: bytes | None = None
+        self._last_mtime_ns: int | None = None
 
     def load(self) -> AppSettings:
         """Load settings from disk.
@@ -94,9 +156,11 @@ class SettingsStore:
         if not self.path.exists():
             return AppSettings()
         try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
+            raw = self.path.read_bytes()
+            data = json.loads(raw.decode("utf-8"))
         except Exception:
             return AppSettings()
+        self._remember(raw)
         return AppSettings.from_json(data)
 
     def save(self, settings: AppSettings) -> None:
@@ -105,6 +169,35 @@ class SettingsStore:
         Args:
             settings: Settings to save
         """
-        payload = settings.to_json()
-        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        data = settings.serialize()
+        if _digest(data) == self._last_hash and self._mtime_ns() == self._last_mtime_ns:
+            # Content unchanged and file not touched since our last write
+            return
+        self.path.write_bytes(data)
+        self._remember(data)
+
+    def _remember(self, data: bytes) -> None:
+        """Record digest and mtime of the on-disk settings content.
+        
+        Args:
+            data: Bytes currently stored in the settings file
+        """
+        self._last_hash = _digest(data)
+        self._last_mtime_ns = self._mtime_ns()
+
+    def _mtime_ns(self) -> int | None:
+        """Get the settings file modification time.
+        
+        Returns:
+            mtime in nanoseconds, or None if the file does not exist
+        """
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+def _digest(data: bytes) -> bytes:
+    """Compute a short content digest for change detection."""
+    return hashlib.blake2b(data, digest_size=8).digest()
 
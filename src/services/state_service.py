@@ -1,9 +1,10 @@
 """Central state management service for the application."""
 from __future__ import annotations
 
-from typing import Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal
 
 from src.models.repository import Repository
 from src.services.settings_service import AppSettings, SettingsStore
@@ -26,10 +27,14 @@ class StateService(QObject):
     entries_updated = Signal()
     profiles_updated = Signal()
     services_updated = Signal()
+    projects_updated = Signal()
     settings_changed = Signal(object)  # AppSettings
     
     _instance: Optional["StateService"] = None
     
+    # Delay before pending settings changes are written to disk
+    SETTINGS_SAVE_DELAY_MS = 500
+    
     def __new__(cls, *args, **kwargs):
         """Singleton pattern: only one instance allowed."""
         if cls._instance is None:
@@ -53,13 +58,32 @@ class StateService(QObject):
         
         # State
         self._current_profile_id: Optional[int] = None
-        self._active_entry: Optional[dict] = None
         self._settings: AppSettings = settings_store.load()
         
+        # A timer left running by a previous session is still active; after
+        # this the cached entry is kept current by TimerService
+        row = repository.get_active_entry()
+        self._active_entry: Optional[dict] = dict(row) if row else None
+        
         # Load last profile if available
         if self._settings.last_profile_id:
             self._current_profile_id = self._settings.last_profile_id
         
+        # Settings writes are debounced; rapid changes end up in a single save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush_settings)
+        
+        # Data-change notifications deferred by batch(), in first-raised order
+        self._batch_depth = 0
+        self._pending_notifications: List[str] = []
+        # Number of notifications raised per signal name, see revision()
+        self._revisions: Dict[str, int] = {}
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_settings)
+        
         self._initialized = True
     
     @classmethod
@@ -88,7 +112,7 @@ class StateService(QObject):
             self._current_profile_id = profile_id
             # Persist to settings
             self._settings.last_profile_id = profile_id
-            self._settings_store.save(self._settings)
+            self._save_timer.start()
             self.profile_changed.emit(profile_id)
     
     def get_current_profile(self) -> Optional[dict]:
@@ -135,25 +159,79 @@ class StateService(QObject):
         """Update application settings.
         
         Args:
-            settings: New settings to save
+            settings: New settings to save (written after a short delay)
         """
         self._settings = settings
-        self._settings_store.save(settings)
+        self._save_timer.start()
         self.settings_changed.emit(settings)
     
+    def flush_settings(self) -> None:
+        """Write pending settings changes to disk immediately."""
+        self._save_timer.stop()
+        self._settings_store.save(self._settings)
+    
     # Notify methods for data changes
     
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer data-change notifications until the outermost batch ends.
+        
+        Each notification raised inside the batch is emitted once when it
+        ends, so multi-step operations trigger a single refresh per signal.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending_notifications = self._pending_notifications, []
+                for name in pending:
+                    getattr(self, name).emit()
+    
     def notify_entries_updated(self) -> None:
         """Notify that time entries have been updated."""
-        self.entries_updated.emit()
+        self._notify("entries_updated")
     
     def notify_profiles_updated(self) -> None:
         """Notify that profiles have been updated."""
-        self.profiles_updated.emit()
+        self._notify("profiles_updated")
     
     def notify_services_updated(self) -> None:
         """Notify that services have been updated."""
-        self.services_updated.emit()
+        self._notify("services_updated")
+    
+    def revision(self, name: str) -> int:
+        """Get how often a data-change notification has been raised.
+        
+        ViewModels compare it with the revision they last loaded to skip
+        reloading data that has not changed since.
+        
+        Args:
+            name: Name of the signal attribute, e.g. "profiles_updated"
+            
+        Returns:
+            Revision counter, 0 if the notification was never raised
+        """
+        return self._revisions.get(name, 0)
+    
+    def notify_projects_updated(self) -> None:
+        """Notify that projects have been updated."""
+        self._notify("projects_updated")
+    
+    def _notify(self, name: str) -> None:
+        """Emit a data-change signal now, or once at the end of the current batch.
+        
+        Args:
+            name: Name of the signal attribute
+        """
+        # Counted right away so refreshes inside a batch see the change
+        self._revisions[name] = self._revisions.get(name, 0) + 1
+        if self._batch_depth:
+            if name not in self._pending_notifications:
+                self._pending_notifications.append(name)
+            return
+        getattr(self, name).emit()
     
     # Repository access (convenience methods)
     
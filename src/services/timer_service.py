@@ -1,10 +1,13 @@
 """Timer management service with state integration."""
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Optional
 
 from PySide6.QtCore import QObject, Signal
 
+from src.services.settings_service import get_data_dir
+
 if TYPE_CHECKING:
     from src.services.state_service import StateService
 
@@ -49,26 +52,29 @@ class TimerService(QObject):
         Returns:
             ID of the created entry
         """
-        # Ensure only one active entry system-wide
-        if self.repo.get_active_entry() is not None:
-            self.stop()
-        
-        entry_id = self.repo.start_entry(profile_id, note, ",".join(tags or []), project_id)
-        prof = self.repo.get_profile(profile_id)
-        
-        # Log event
-        self._log_event("START", profile_id, prof["name"] if prof else "", note)
-        
-        # Update state
-        self.state.refresh_active_entry()
-        self.state.notify_entries_updated()
+        # Switching timers stops one entry and starts another; listeners
+        # refresh once for both
+        with self.state.batch():
+            # Ensure only one active entry system-wide
+            if self.state.active_entry is not None:
+                self.stop()
+            
+            entry_id = self.repo.start_entry(profile_id, note, ",".join(tags or []), project_id)
+            prof = self.repo.get_profile(profile_id)
+            
+            # Log event
+            self._log_event("START", profile_id, prof["name"] if prof else "", note)
+            
+            # Update state
+            self.state.refresh_active_entry()
+            self.state.notify_entries_updated()
         
         self.timer_started.emit(entry_id)
         return entry_id
     
     def stop(self) -> None:
         """Stop the currently active timer."""
-        active = self.repo.get_active_entry()
+        active = self.state.active_entry
         if active is None:
             return
         
@@ -79,7 +85,7 @@ class TimerService(QObject):
         self._log_event("STOP", int(active["profile_id"]), prof["name"] if prof else "", active["note"] or "")
         
         # Update state
-        self.state.refresh_active_entry()
+        self.state.set_active_entry(None)
         self.state.notify_entries_updated()
         
         self.timer_stopped.emit()
@@ -93,9 +99,6 @@ class TimerService(QObject):
             profile_name: Profile name
             note: Entry note
         """
-        from src.services.settings_service import get_data_dir
-        import time
-        
         log_path = get_data_dir() / "solia.log"
         try:
             log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -4,8 +4,8 @@ from __future__ import annotations
 import math
 from typing import Optional
 
-from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QPainter, QPen
+from PySide6.QtCore import QEvent, QRect, QSize, Qt
+from PySide6.QtGui import QPainter, QPen, QPixmap, QRegion
 from PySide6.QtWidgets import QWidget
 
 
@@ -17,7 +17,14 @@ class CircularProgress(QWidget):
         self._elapsed_seconds: int = 0
         self._target_seconds: int | None = None
         self._size = 64
+        # What the last requested repaint shows: (arc span in degrees, percent text)
+        self._render_key: tuple[int, str] | None = None
+        # Ring geometry and the pre-rendered background ring, rebuilt on resize
+        # and palette changes
+        self._ring_rect = self.rect().adjusted(4, 4, -4, -4)
+        self._ring_pixmap: QPixmap | None = None
         self.setMinimumSize(self._size, self._size)
+        self._rebuild_pens()
 
     def sizeHint(self) -> QSize:  # type: ignore[override]
         return QSize(self._size, self._size)
@@ -31,7 +38,24 @@ class CircularProgress(QWidget):
         """
         self._elapsed_seconds = max(0, int(elapsed_seconds))
         self._target_seconds = int(target_seconds) if target_seconds is not None else None
-        self.update()
+        
+        # Values arrive every tick but the drawing changes far less often
+        key = self._compute_render_key()
+        old_key = self._render_key
+        if key == old_key:
+            return
+        self._render_key = key
+        if old_key is None:
+            self.update()
+            return
+        
+        # Repaint only the part of the arc that moved and the percentage text
+        dirty = QRegion()
+        if key[0] != old_key[0]:
+            dirty += QRegion(self._arc_dirty_rect(old_key[0], key[0]))
+        if key[1] != old_key[1]:
+            dirty += QRegion(self._text_rect(old_key[1]).united(self._text_rect(key[1])))
+        self.update(dirty)
 
     def _ratio(self) -> float:
         """Calculate progress ratio (0.0 to 1.0)."""
@@ -39,30 +63,96 @@ class CircularProgress(QWidget):
             return 0.0
         return max(0.0, min(1.0, float(self._elapsed_seconds) / float(self._target_seconds)))
 
+    def changeEvent(self, event: QEvent) -> None:  # type: ignore[override]
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._rebuild_pens()
+            self._ring_pixmap = None
+        super().changeEvent(event)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        self._ring_rect = self.rect().adjusted(4, 4, -4, -4)
+        self._ring_pixmap = None
+        super().resizeEvent(event)
+
+    def _rebuild_pens(self) -> None:
+        """Create the pens from the current palette."""
+        palette = self.palette()
+        self._base_pen = QPen(palette.mid().color(), 6)
+        self._progress_pen = QPen(palette.highlight().color(), 6)
+        self._text_pen = QPen(palette.text().color())
+
+    def _compute_render_key(self) -> tuple[int, str]:
+        """Get the arc span (whole degrees) and percentage text to draw."""
+        ratio = self._ratio()
+        span_degrees = int(-360 * ratio)
+        percent_text = "—%"
+        if self._target_seconds and self._target_seconds > 0:
+            pct = int(max(0, min(100, math.ceil(ratio * 100))))
+            percent_text = f"{pct}%"
+        return span_degrees, percent_text
+
+    def _arc_dirty_rect(self, old_span: int, new_span: int) -> QRect:
+        """Get the area covered by the arc between two spans (in degrees)."""
+        rect = self._ring_rect
+        cx = rect.x() + rect.width() / 2
+        cy = rect.y() + rect.height() / 2
+        rx = rect.width() / 2
+        ry = rect.height() / 2
+        lo, hi = sorted((old_span, new_span))
+        # The arc bulges furthest where it crosses a multiple of 90 degrees
+        spans = [lo, hi] + [a for a in range(-360, 1, 90) if lo < a < hi]
+        xs = []
+        ys = []
+        for span in spans:
+            angle = math.radians(90 + span)
+            xs.append(cx + rx * math.cos(angle))
+            ys.append(cy - ry * math.sin(angle))
+        margin = math.ceil(self._progress_pen.widthF() / 2) + 1
+        return QRect(
+            math.floor(min(xs)) - margin,
+            math.floor(min(ys)) - margin,
+            math.ceil(max(xs) - min(xs)) + 2 * margin + 1,
+            math.ceil(max(ys) - min(ys)) + 2 * margin + 1,
+        )
+
+    def _text_rect(self, text: str) -> QRect:
+        """Get the area covered by the centered percentage text."""
+        rect = self.fontMetrics().boundingRect(self.rect(), Qt.AlignCenter, text)
+        return rect.adjusted(-1, -1, 1, 1)
+
+    def _ring(self) -> QPixmap:
+        """Get the background ring, rendering it once per size and palette."""
+        if self._ring_pixmap is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.setPen(self._base_pen)
+            painter.drawEllipse(self._ring_rect)
+            painter.end()
+            self._ring_pixmap = pixmap
+        return self._ring_pixmap
+
     def paintEvent(self, event) -> None:  # type: ignore[override]
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.drawPixmap(0, 0, self._ring())
 
-        rect = self.rect().adjusted(4, 4, -4, -4)
-        base_pen = QPen(self.palette().mid().color(), 6)
-        painter.setPen(base_pen)
-        painter.drawEllipse(rect)
+        rect = self._ring_rect
 
-        ratio = self._ratio()
-        if ratio > 0:
+        span_degrees, percent_text = self._render_key or self._compute_render_key()
+        if span_degrees:
             # Use highlight color for progress arc
-            progress_pen = QPen(self.palette().highlight().color(), 6)
-            painter.setPen(progress_pen)
+            painter.setPen(self._progress_pen)
+            # Only the arc needs antialiasing; the ring is pre-rendered
+            painter.setRenderHint(QPainter.Antialiasing, True)
             # Start at 90 deg (top) and go clockwise negative angle
             start_angle = 90 * 16
-            span_angle = int(-360 * 16 * ratio)
-            painter.drawArc(rect, start_angle, span_angle)
+            painter.drawArc(rect, start_angle, span_degrees * 16)
+            painter.setRenderHint(QPainter.Antialiasing, False)
 
         # Draw centered percentage text
-        painter.setPen(QPen(self.palette().text().color()))
-        percent_text = "—%"
-        if self._target_seconds and self._target_seconds > 0:
-            pct = int(max(0, min(100, math.ceil(ratio * 100))))
-            percent_text = f"{pct}%"
+        painter.setPen(self._text_pen)
         painter.drawText(self.rect(), Qt.AlignCenter, percent_text)
 
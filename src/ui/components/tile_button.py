@@ -10,6 +10,19 @@ from PySide6.QtWidgets import QFrame, QLabel, QSizePolicy, QVBoxLayout, QWidget
 class TileButton(QFrame):
     """A clickable tile button for the home dashboard."""
 
+    # Rounded corners and lighter background, shared by all tiles
+    STYLE_SHEET = """
+        TileButton {
+            background-color: rgba(255, 255, 255, 0.08);
+            border-radius: 15px;
+            border: 2px solid rgba(255, 255, 255, 0.1);
+        }
+        TileButton:hover {
+            background-color: rgba(255, 255, 255, 0.12);
+            border: 2px solid rgba(255, 255, 255, 0.2);
+        }
+    """
+
     def __init__(self, title: str, icon_char: str, parent: QWidget | None = None) -> None:
         """Initialize tile button.
         
@@ -25,18 +38,7 @@ class TileButton(QFrame):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setCursor(Qt.PointingHandCursor)
         
-        # Apply rounded corners and lighter background
-        self.setStyleSheet("""
-            TileButton {
-                background-color: rgba(255, 255, 255, 0.08);
-                border-radius: 15px;
-                border: 2px solid rgba(255, 255, 255, 0.1);
-            }
-            TileButton:hover {
-                background-color: rgba(255, 255, 255, 0.12);
-                border: 2px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
+        self.setStyleSheet(self.STYLE_SHEET)
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
@@ -0,0 +1,33 @@
+"""Application icon lookup."""
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from PySide6.QtGui import QIcon
+
+
+@lru_cache(maxsize=1)
+def app_icon() -> QIcon:
+    """Load the application icon from resources.
+
+    The file system is probed only once per process; later calls return
+    the same icon.
+
+    Returns:
+        The icon, or a null QIcon if no icon file was found
+    """
+    try:
+        base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent))
+        candidates = [
+            base / "ui" / "resources" / "App.ico",
+            base / "ui" / "resources" / "app.ico",
+            base / "ui" / "resources" / "App.png",
+        ]
+        for p in candidates:
+            if p.exists():
+                return QIcon(str(p))
+    except Exception:
+        pass
+    return QIcon()
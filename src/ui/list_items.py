@@ -0,0 +1,40 @@
+"""Helpers for filling list widgets."""
+from __future__ import annotations
+
+from typing import Dict, Sequence
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QListWidget, QListWidgetItem
+
+
+def set_id_items(list_widget: QListWidget, items: Sequence[tuple[int, str]]) -> Dict[int, int]:
+    """Show (id, text) items in a list widget, storing each id in Qt.UserRole.
+
+    When the widget already lists the same ids in the same order, the
+    existing items are relabeled in place so no items are recreated and the
+    selection is kept. Otherwise the list is rebuilt.
+
+    Args:
+        list_widget: List widget to fill
+        items: (id, text) pairs in display order
+
+    Returns:
+        Row of each id, for selecting items without scanning the list
+    """
+    rows = {item_id: row for row, (item_id, _) in enumerate(items)}
+    count = list_widget.count()
+    if count == len(items) and all(
+        list_widget.item(row).data(Qt.UserRole) == item_id for row, (item_id, _) in enumerate(items)
+    ):
+        for row, (_, text) in enumerate(items):
+            it = list_widget.item(row)
+            if it.text() != text:
+                it.setText(text)
+        return rows
+
+    list_widget.clear()
+    for item_id, text in items:
+        it = QListWidgetItem(text)
+        it.setData(Qt.UserRole, item_id)
+        list_widget.addItem(it)
+    return rows
@@ -0,0 +1,4 @@
+"""Qt item models backing the views."""
+from .entries_model import EntriesFilterProxyModel, EntriesModel
+
+__all__ = ["EntriesFilterProxyModel", "EntriesModel"]
@@ -0,0 +1,253 @@
+"""Table model for time entries with incremental loading."""
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QSortFilterProxyModel,
+    Qt,
+    Signal,
+)
+
+from src.utils.formatters import format_duration, format_timestamp
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from src.viewmodels import TimerViewModel
+
+
+class EntriesModel(QAbstractTableModel):
+    """Table model showing time entries page by page.
+
+    Rows are pulled from the TimerViewModel in pages as the view scrolls,
+    so long histories are never loaded in one go.
+    """
+
+    HEADERS = ["Profile", "Project", "Start", "End", "Duration", "Note"]
+    DURATION_COLUMN = 4
+
+    # Emitted when the user edits a cell: row, column, new text
+    cell_edited = Signal(int, int, str)
+
+    def __init__(self, viewmodel: "TimerViewModel", parent: QObject | None = None) -> None:
+        """Initialize entries model.
+
+        Args:
+            viewmodel: Timer ViewModel providing entry pages
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.viewmodel = viewmodel
+        self._rows: List["sqlite3.Row"] = list(viewmodel.entries)
+        self._ids: List[int] = [int(e["id"]) for e in self._rows]
+        self._texts: List[Optional[tuple]] = [None] * len(self._rows)
+        self._now = int(time.time())
+
+        self.viewmodel.entries_changed.connect(self.set_entries)
+        self.viewmodel.entries_appended.connect(self._append_entries)
+
+    # Public methods
+
+    def set_entries(self, entries: list) -> None:
+        """Replace all rows.
+
+        Rows identical to the current ones are kept as they are, so refreshes
+        that change nothing don't reset the view or reformat every cell.
+
+        Args:
+            entries: List of entry rows
+        """
+        entries = list(entries)
+        if entries == self._rows:
+            self._refresh_running_rows()
+            return
+        self.beginResetModel()
+        self._rows = entries
+        self._ids = [int(e["id"]) for e in self._rows]
+        self._texts = [None] * len(self._rows)
+        self._now = int(time.time())
+        self.endResetModel()
+
+    def entry_at(self, row: int) -> Optional["sqlite3.Row"]:
+        """Get the entry shown at a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Entry row or None
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def entry_ids(self, rows: List[int]) -> List[int]:
+        """Get the entry IDs shown at the given rows.
+
+        Args:
+            rows: Row indexes
+
+        Returns:
+            Entry IDs of the valid rows, in the given order
+        """
+        ids = self._ids
+        return [ids[row] for row in rows if 0 <= row < len(ids)]
+
+    # QAbstractTableModel interface
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._row_texts(index.row())[index.column()]
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:  # type: ignore[override]
+        base = super().flags(index)
+        if index.isValid() and index.column() != self.DURATION_COLUMN:
+            base |= Qt.ItemIsEditable
+        return base
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:  # type: ignore[override]
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        # The edit is applied by the ViewModel, which refreshes the rows afterwards
+        self.cell_edited.emit(index.row(), index.column(), str(value).strip())
+        return True
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:  # type: ignore[override]
+        if parent.isValid():
+            return False
+        return self.viewmodel.can_fetch_more_entries()
+
+    def fetchMore(self, parent: QModelIndex) -> None:  # type: ignore[override]
+        if parent.isValid():
+            return
+        self.viewmodel.fetch_more_entries()
+
+    # Private methods
+
+    def _append_entries(self, entries: list) -> None:
+        """Append a page of rows fetched by the ViewModel."""
+        if not entries:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._rows.extend(entries)
+        self._ids.extend(int(e["id"]) for e in entries)
+        self._texts.extend([None] * len(entries))
+        self.endInsertRows()
+
+    def _refresh_running_rows(self) -> None:
+        """Recompute the duration of rows whose entry is still running."""
+        self._now = int(time.time())
+        col = self.DURATION_COLUMN
+        for row, entry in enumerate(self._rows):
+            if entry["end_ts"] is None:
+                self._texts[row] = None
+                index = self.index(row, col)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def _row_texts(self, row: int) -> tuple:
+        """Get the display texts of a row, formatting it on first use."""
+        texts = self._texts[row]
+        if texts is None:
+            texts = self._texts[row] = self._format_row(self._rows[row])
+        return texts
+
+    def _format_row(self, entry: "sqlite3.Row") -> tuple:
+        """Format all cells of an entry row at once."""
+        start_ts = entry["start_ts"]
+        end_ts = entry["end_ts"]
+        start_ts = int(start_ts) if start_ts is not None else None
+        end_ts = int(end_ts) if end_ts is not None else None
+        if start_ts is None:
+            dur = 0
+        else:
+            dur = (end_ts if end_ts is not None else self._now) - start_ts
+        return (
+            str(entry["profile_name"]),
+            str(entry["project_name"] or "—"),
+            format_timestamp(start_ts if start_ts is not None else 0),
+            format_timestamp(end_ts) if end_ts is not None else "—",
+            format_duration(dur),
+            str(entry["note"]),
+        )
+
+
+class EntriesFilterProxyModel(QSortFilterProxyModel):
+    """Proxy filtering an EntriesModel by profile and project in memory."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._profile_id: Optional[int] = None
+        self._project_id: Optional[int] = None
+
+    def set_filter(self, profile_id: Optional[int], project_id: Optional[int]) -> None:
+        """Show only entries of a profile and/or project.
+
+        Args:
+            profile_id: Profile ID to keep, or None for all profiles
+            project_id: Project ID to keep, or None for all projects
+        """
+        if (profile_id, project_id) == (self._profile_id, self._project_id):
+            return
+        self._profile_id = profile_id
+        self._project_id = project_id
+        self.invalidateFilter()
+
+    def entry_at(self, row: int) -> Optional["sqlite3.Row"]:
+        """Get the entry shown at a proxy row.
+
+        Args:
+            row: Proxy row index
+
+        Returns:
+            Entry row or None
+        """
+        source = self.sourceModel()
+        if source is None:
+            return None
+        index = self.mapToSource(self.index(row, 0))
+        return source.entry_at(index.row()) if index.isValid() else None
+
+    def entry_ids(self, rows: List[int]) -> List[int]:
+        """Get the entry IDs shown at the given proxy rows.
+
+        Args:
+            rows: Proxy row indexes
+
+        Returns:
+            Entry IDs of the valid rows, in the given order
+        """
+        source = self.sourceModel()
+        if source is None:
+            return []
+        source_rows = [self.mapToSource(self.index(row, 0)).row() for row in rows]
+        return source.entry_ids(source_rows)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # type: ignore[override]
+        if self._profile_id is None and self._project_id is None:
+            return True
+        entry = self.sourceModel().entry_at(source_row)
+        if entry is None:
+            return False
+        if self._profile_id is not None and entry["profile_id"] != self._profile_id:
+            return False
+        if self._project_id is not None and entry["project_id"] != self._project_id:
+            return False
+        return True
@@ -1,28 +1,59 @@
 """Formatting and parsing utilities for time, currency, and other data types."""
 from __future__ import annotations
 
+import re
 import time
+from functools import lru_cache
 from typing import Optional
 
 
+# Zero-padded "00".."99" used by the duration formatters
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+# Durations below one hour ("00:00:00".."00:59:59"), indexed by seconds;
+# covers a running timer's first hour and most short entries
+_SHORT_DURATIONS = tuple(f"00:{m}:{s}" for m in _TWO_DIGITS[:60] for s in _TWO_DIGITS[:60])
+
+# Time input "H", "HH:MM" (signs and blanks around the numbers as int() allows)
+_TIME_RE = re.compile(r"\s*([+-]?\d+)\s*(?::\s*([+-]?\d+)\s*)?")
+
+# Rate input normalization: drop spaces and "€", use "," as decimal separator
+_RATE_TRANS = str.maketrans({" ": None, "€": None, ".": ","})
+
+
 def format_duration(seconds: int) -> str:
     """Format duration in seconds as HH:MM:SS string.
     
+    Durations below one hour come from a precomputed table; longer ones
+    are cached, since entry lists repeat the same durations often.
+    
     Args:
         seconds: Duration in seconds
         
     Returns:
         Formatted string like "02:30:15"
     """
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
-    return f"{h:02d}:{m:02d}:{s:02d}"
+    seconds = int(seconds)
+    if 0 <= seconds < 3600:
+        return _SHORT_DURATIONS[seconds]
+    return _format_long_duration(seconds)
+
 
+@lru_cache(maxsize=4096)
+def _format_long_duration(seconds: int) -> str:
+    """Format a duration outside the table; see format_duration."""
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    hh = _TWO_DIGITS[h] if 0 <= h < 100 else f"{h:02d}"
+    return f"{hh}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[s]}"
 
+
+@lru_cache(maxsize=4096)
 def format_timestamp(ts: int, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
     """Format Unix timestamp as human-readable string.
     
+    Results are cached; back-to-back entries share start/end timestamps.
+    
     Args:
         ts: Unix timestamp in seconds
         fmt: strftime format string
@@ -42,22 +73,14 @@ def parse_time_input(text: str) -> Optional[int]:
     Returns:
         Time in seconds, or None if invalid
     """
-    text = text.strip()
-    if not text:
+    m = _TIME_RE.fullmatch(text)
+    if m is None:
         return None
-    try:
-        if ":" in text:
-            hh, mm = text.split(":", 1)
-            hours = int(hh)
-            minutes = int(mm)
-        else:
-            hours = int(text)
-            minutes = 0
-        if hours < 0 or minutes < 0 or minutes >= 60:
-            return None
-        return hours * 3600 + minutes * 60
-    except Exception:
+    hours = int(m.group(1))
+    minutes = int(m.group(2) or 0)
+    if hours < 0 or minutes < 0 or minutes >= 60:
         return None
+    return hours * 3600 + minutes * 60
 
 
 def parse_rate_input(text: str) -> Optional[int]:
@@ -76,25 +99,24 @@ def parse_rate_input(text: str) -> Optional[int]:
         return None
     
     # Normalize: remove spaces, €, and convert . to ,
-    norm = text.replace(" ", "").replace("€", "").replace(".", ",")
+    norm = text.translate(_RATE_TRANS)
     
-    try:
-        if "," in norm:
-            left, right = norm.split(",", 1)
-            euros = int(left) if left else 0
-            # Pad/truncate to 2 decimals
-            right2 = (right + "00")[:2]
-            cents = int(right2)
-        else:
-            euros = int(norm)
-            cents = 0
-        
-        if euros < 0 or cents < 0 or cents >= 100:
+    # Checked up front so partial input while typing doesn't raise
+    if "," in norm:
+        left, right = norm.split(",", 1)
+        # Pad/truncate to 2 decimals
+        right2 = (right + "00")[:2]
+        if (left and not left.isdecimal()) or not right2.isdecimal():
             return None
-        
-        return euros * 100 + cents
-    except Exception:
-        return None
+        euros = int(left) if left else 0
+        cents = int(right2)
+    else:
+        if not norm.isdecimal():
+            return None
+        euros = int(norm)
+        cents = 0
+    
+    return euros * 100 + cents
 
 
 def format_rate(cents: int) -> str:
@@ -120,9 +142,15 @@ def format_time_hhmm(seconds: int) -> str:
     Returns:
         Formatted string like "02:30"
     """
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    return f"{h:02d}:{m:02d}"
+    return _format_minutes_hhmm(int(seconds) // 60)
+
+
+@lru_cache(maxsize=4096)
+def _format_minutes_hhmm(minutes: int) -> str:
+    """Format whole minutes as HH:MM; see format_time_hhmm."""
+    h, m = divmod(minutes, 60)
+    hh = _TWO_DIGITS[h] if 0 <= h < 100 else f"{h:02d}"
+    return f"{hh}:{_TWO_DIGITS[m]}"
 
 
 def parse_timestamp(text: str) -> Optional[int]:
@@ -137,6 +165,12 @@ def parse_timestamp(text: str) -> Optional[int]:
     text = text.strip()
     if not text or text == "—":
         return None
+    return _parse_timestamp_cached(text)
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp_cached(text: str) -> Optional[int]:
+    """Parse a stripped, non-empty timestamp string; see parse_timestamp."""
     try:
         return int(time.mktime(time.strptime(text, "%Y-%m-%d %H:%M:%S")))
     except Exception:
@@ -1,5 +1,5 @@
 """ViewModels for presentation logic."""
-from .dashboard_viewmodel import DashboardViewModel
+from .dashboard_viewmodel import DashboardViewModel, NavTarget
 from .invoices_viewmodel import InvoicesViewModel
 from .profiles_viewmodel import ProfilesViewModel
 from .projects_viewmodel import ProjectsViewModel
@@ -11,6 +11,7 @@ from .weekly_viewmodel import WeeklyViewModel
 __all__ = [
     "DashboardViewModel",
     "InvoicesViewModel",
+    "NavTarget",
     "ProfilesViewModel",
     "ProjectsViewModel",
     "ServicesViewModel",
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, List, Optional
 from PySide6.QtCore import QObject, Signal
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from src.services.state_service import StateService
     from src.services.timer_service import TimerService
 
@@ -21,10 +23,10 @@ class ProfilesViewModel(QObject):
     """
     
     # Signals
-    profiles_changed = Signal(list)  # List of profile dicts
+    profiles_changed = Signal(list)  # List of profile rows
     profile_selected = Signal(object)  # Optional[int] - profile_id
-    projects_changed = Signal(list)  # List of project dicts
-    todos_changed = Signal(list)  # List of todo dicts
+    projects_changed = Signal(list)  # List of project rows
+    todos_changed = Signal(list)  # List of todo rows
     navigate_to_project_requested = Signal(int)  # project_id to navigate to
     error_occurred = Signal(str, str)  # title, message
     
@@ -40,14 +42,22 @@ class ProfilesViewModel(QObject):
         self.timer_service = timer_service
         self.repo = state_service.repository
         
-        # Internal state
-        self._profiles: List[dict] = []
-        self._projects: List[dict] = []
-        self._todos: List[dict] = []
+        # Internal state; rows are kept as returned by the repository
+        # (sqlite3.Row supports lookup by column name, so no dict copies)
+        self._profiles: List["sqlite3.Row"] = []
+        self._projects: List["sqlite3.Row"] = []
+        self._todos: List["sqlite3.Row"] = []
+        # Names of all profiles including archived ones; built on demand
+        self._profile_names: Optional[set[str]] = None
+        self._profiles_revision: Optional[int] = None  # State revision of _profiles
+        # All projects grouped by profile_id, and the state revisions it was built at
+        self._projects_by_profile: dict[int, List["sqlite3.Row"]] = {}
+        self._projects_index_key: Optional[tuple[int, int, int]] = None
         
         # Connect to state changes
         self.state.profiles_updated.connect(self._refresh_profiles)
         self.state.profile_changed.connect(self._on_profile_changed)
+        self.state.projects_updated.connect(self._on_projects_updated)
         
         # Initial load
         self._refresh_profiles()
@@ -55,7 +65,7 @@ class ProfilesViewModel(QObject):
     # Properties
     
     @property
-    def profiles(self) -> List[dict]:
+    def profiles(self) -> List["sqlite3.Row"]:
         """Get list of all profiles."""
         return self._profiles
     
@@ -70,12 +80,12 @@ class ProfilesViewModel(QObject):
         return self.state.current_profile_id
     
     @property
-    def projects(self) -> List[dict]:
+    def projects(self) -> List["sqlite3.Row"]:
         """Get projects for current profile."""
         return self._projects
     
     @property
-    def todos(self) -> List[dict]:
+    def todos(self) -> List["sqlite3.Row"]:
         """Get todos for current profile."""
         return self._todos
     
@@ -133,31 +143,40 @@ class ProfilesViewModel(QObject):
         if not prof:
             return
         
-        # Update name - always update if provided
-        if name is not None:
+        # Only fields that differ from the stored profile are written; saving
+        # an unchanged form neither touches the database nor refreshes views
+        changed = False
+        
+        # Update name if provided
+        if name is not None and name != prof["name"]:
             self.repo.rename_profile(profile_id, name)
+            changed = True
         
         # Update contacts - when saving from the form, all fields are always provided
         # (even if None for cleared fields), so we always update all contact fields
         # to ensure overwrites work correctly. We detect this by checking if name was
         # provided (which indicates a form save) or if any contact field is provided.
         if name is not None or any(x is not None for x in [contact_person, email, phone, business_address]):
-            # Update all contact fields with provided values
-            # None values will clear existing fields (overwrite mode)
-            self.repo.update_profile_contacts(
-                profile_id,
-                None,  # company is always None now
-                contact_person,  # Use provided value (None if cleared, None if not provided)
-                email,  # Use provided value (None if cleared, None if not provided)
-                phone,  # Use provided value (None if cleared, None if not provided)
-                business_address,  # Use provided value (None if cleared, None if not provided)
+            # company is always None now; None values clear existing fields (overwrite mode)
+            contacts = (None, contact_person, email, phone, business_address)
+            current = (
+                prof["company"],
+                prof["contact_person"],
+                prof["email"],
+                prof["phone"],
+                prof["business_address"],
             )
+            if contacts != current:
+                self.repo.update_profile_contacts(profile_id, *contacts)
+                changed = True
         
-        # Update notes - always update if provided (including None to clear)
-        if notes is not None:
+        # Update notes if provided
+        if notes is not None and notes != prof["notes"]:
             self.repo.set_profile_notes(profile_id, notes)
+            changed = True
         
-        self.state.notify_profiles_updated()
+        if changed:
+            self.state.notify_profiles_updated()
     
     def delete_profile(self, profile_id: int, force: bool = False) -> bool:
         """Delete a profile.
@@ -170,19 +189,20 @@ class ProfilesViewModel(QObject):
             True if deleted, False if blocked (timer running)
         """
         # Check if timer is running for this profile
-        if not force:
-            active = self.timer_service.get_active_entry()
-            if active is not None and int(active["profile_id"]) == profile_id:
-                return False  # View should confirm with user
-        
-        # Stop timer if running
         active = self.timer_service.get_active_entry()
-        if active is not None and int(active["profile_id"]) == profile_id:
-            self.timer_service.stop()
+        timer_running = active is not None and int(active["profile_id"]) == profile_id
+        if timer_running and not force:
+            return False  # View should confirm with user
         
-        self.repo.delete_profile(profile_id)
-        self.state.notify_profiles_updated()
-        self.state.notify_entries_updated()
+        # Stopping the timer and deleting both report entry changes; refresh once
+        with self.state.batch():
+            # Stop timer if running
+            if timer_running:
+                self.timer_service.stop()
+            
+            self.repo.delete_profile(profile_id)
+            self.state.notify_profiles_updated()
+            self.state.notify_entries_updated()
         return True
     
     def duplicate_profile(self, source_id: int, new_name: str) -> int:
@@ -206,19 +226,14 @@ class ProfilesViewModel(QObject):
         business_address = prof["business_address"] or None
         notes = prof["notes"] or None
         
-        new_id = self.repo.create_profile(
-            new_name, None, None, None, contact, email, phone, business_address, notes
-        )
-        
-        # Copy todos
-        for todo in self.repo.list_profile_todos(source_id):
-            text = str(todo["text"])
-            completed = int(todo["completed"]) if todo["completed"] is not None else 0
-            new_todo_id = self.repo.add_profile_todo(new_id, text)
-            if completed:
-                self.repo.set_profile_todo_completed(new_todo_id, True)
-        
-        self.state.notify_profiles_updated()
+        with self.state.batch():
+            new_id = self.repo.create_profile(
+                new_name, None, None, None, contact, email, phone, business_address, notes
+            )
+            
+            self.repo.copy_profile_todos(source_id, new_id)
+            
+            self.state.notify_profiles_updated()
         self.select_profile(new_id)
         return new_id
     
@@ -231,7 +246,10 @@ class ProfilesViewModel(QObject):
         Returns:
             Unique name like "Base (Copy)" or "Base (Copy 2)"
         """
-        existing = {str(r["name"]) for r in self.repo.list_profiles(include_archived=True)}
+        if self._profile_names is None:
+            rows = self.repo.list_profiles(include_archived=True)
+            self._profile_names = {str(r["name"]) for r in rows}
+        existing = self._profile_names
         candidate = f"{base_name} (Copy)"
         if candidate not in existing:
             return candidate
@@ -270,8 +288,8 @@ class ProfilesViewModel(QObject):
             todo_id: Todo ID
             profile_id: Profile ID (for refresh)
         """
-        self.repo.delete_profile_todo(todo_id)
-        self._load_todos(profile_id)
+        if self.repo.delete_profile_todo(todo_id):
+            self._load_todos(profile_id)
     
     def toggle_todo_completed(self, todo_id: int, completed: bool, profile_id: int) -> None:
         """Toggle todo completion state.
@@ -281,8 +299,9 @@ class ProfilesViewModel(QObject):
             completed: New completion state
             profile_id: Profile ID (for refresh)
         """
-        self.repo.set_profile_todo_completed(todo_id, completed)
-        self._load_todos(profile_id)
+        # Repeated toggles (e.g. double clicks) leave the todo unchanged
+        if self.repo.set_profile_todo_completed(todo_id, completed):
+            self._load_todos(profile_id)
     
     def load_todos(self, profile_id: int) -> None:
         """Load todos for a profile.
@@ -311,9 +330,13 @@ class ProfilesViewModel(QObject):
     # Private methods
     
     def _refresh_profiles(self) -> None:
-        """Refresh profiles list from database."""
-        rows = self.repo.list_profiles()
-        self._profiles = [dict(row) for row in rows]
+        """Refresh profiles list from database, unless it is already current."""
+        revision = self.state.revision("profiles_updated")
+        if revision == self._profiles_revision:
+            return
+        self._profiles_revision = revision
+        self._profiles = self.repo.list_profiles()
+        self._profile_names = None
         self.profiles_changed.emit(self._profiles)
     
     def _on_profile_changed(self, profile_id: Optional[int]) -> None:
@@ -323,14 +346,30 @@ class ProfilesViewModel(QObject):
             self._load_projects(profile_id)
             self._load_todos(profile_id)
     
+    def _on_projects_updated(self) -> None:
+        """Reload the current profile's projects after a project write."""
+        profile_id = self.current_profile_id
+        if profile_id is not None:
+            self._load_projects(profile_id)
+    
     def _load_projects(self, profile_id: int) -> None:
         """Load projects for a profile.
         
         Args:
             profile_id: Profile ID
         """
-        rows = self.repo.list_projects(profile_id=profile_id)
-        self._projects = [dict(row) for row in rows]
+        # Project rows join service and profile names, so renames invalidate too
+        key = (
+            self.state.revision("projects_updated"),
+            self.state.revision("services_updated"),
+            self.state.revision("profiles_updated"),
+        )
+        if key != self._projects_index_key:
+            self._projects_index_key = key
+            self._projects_by_profile = {}
+            for project in self.repo.list_projects():
+                self._projects_by_profile.setdefault(project["profile_id"], []).append(project)
+        self._projects = self._projects_by_profile.get(profile_id, [])
         self.projects_changed.emit(self._projects)
     
     def _load_todos(self, profile_id: int) -> None:
@@ -339,7 +378,6 @@ class ProfilesViewModel(QObject):
         Args:
             profile_id: Profile ID
         """
-        rows = self.repo.list_profile_todos(profile_id)
-        self._todos = [dict(row) for row in rows]
+        self._todos = self.repo.list_profile_todos(profile_id)
         self.todos_changed.emit(self._todos)
 
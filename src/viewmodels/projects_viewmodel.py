@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, List, Optional
 from PySide6.QtCore import QObject, Signal
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from src.services.state_service import StateService
 
 
@@ -19,11 +21,11 @@ class ProjectsViewModel(QObject):
     """
     
     # Signals
-    projects_changed = Signal(list)  # List of project dicts
+    projects_changed = Signal(list)  # List of project rows
     project_selected = Signal(object)  # Optional[int] - project_id
-    todos_changed = Signal(list)  # List of todo dicts
-    profiles_changed = Signal(list)  # List of profile dicts
-    services_changed = Signal(list)  # List of service dicts
+    todos_changed = Signal(list)  # List of todo rows
+    profiles_changed = Signal(list)  # List of profile rows
+    services_changed = Signal(list)  # List of service rows
     error_occurred = Signal(str, str)  # title, message
     
     def __init__(self, state_service: "StateService") -> None:
@@ -36,16 +38,21 @@ class ProjectsViewModel(QObject):
         self.state = state_service
         self.repo = state_service.repository
         
-        # Internal state
-        self._projects: List[dict] = []
-        self._todos: List[dict] = []
-        self._profiles: List[dict] = []
-        self._services: List[dict] = []
+        # Internal state; rows are kept as returned by the repository
+        self._projects: List["sqlite3.Row"] = []  # Projects passing the profile filter
+        self._all_projects: List["sqlite3.Row"] = []
+        self._todos: List["sqlite3.Row"] = []
+        self._profiles: List["sqlite3.Row"] = []
+        self._services: List["sqlite3.Row"] = []
+        # State revisions the lists above were loaded at
+        self._profiles_revision: Optional[int] = None
+        self._services_revision: Optional[int] = None
         self._current_project_id: Optional[int] = None
         self._selected_profile_id: Optional[int] = None
         
         # Connect to state changes
-        self.state.profiles_updated.connect(self._refresh_profiles)
+        self.state.profiles_updated.connect(self._on_profiles_updated)
+        self.state.services_updated.connect(self._on_services_updated)
         
         # Initial load
         self._refresh_profiles()
@@ -55,17 +62,17 @@ class ProjectsViewModel(QObject):
     # Properties
     
     @property
-    def projects(self) -> List[dict]:
+    def projects(self) -> List["sqlite3.Row"]:
         """Get list of all projects."""
         return self._projects
     
     @property
-    def profiles(self) -> List[dict]:
+    def profiles(self) -> List["sqlite3.Row"]:
         """Get list of all profiles."""
         return self._profiles
     
     @property
-    def services(self) -> List[dict]:
+    def services(self) -> List["sqlite3.Row"]:
         """Get list of all services."""
         return self._services
     
@@ -80,7 +87,7 @@ class ProjectsViewModel(QObject):
         return self._selected_profile_id
     
     @property
-    def todos(self) -> List[dict]:
+    def todos(self) -> List["sqlite3.Row"]:
         """Get todos for current project."""
         return self._todos
     
@@ -119,6 +126,7 @@ class ProjectsViewModel(QObject):
             start_date_ts, invoice_sent, invoice_paid, notes
         )
         self._refresh_projects()
+        self.state.notify_projects_updated()
         self.select_project(project_id)
         return project_id
     
@@ -152,6 +160,7 @@ class ProjectsViewModel(QObject):
             start_date_ts, invoice_sent, invoice_paid, notes
         )
         self._refresh_projects()
+        self.state.notify_projects_updated()
     
     def delete_project(self, project_id: int) -> None:
         """Delete a project.
@@ -164,6 +173,7 @@ class ProjectsViewModel(QObject):
             self._current_project_id = None
             self.project_selected.emit(None)
         self._refresh_projects()
+        self.state.notify_projects_updated()
     
     def select_project(self, project_id: Optional[int]) -> None:
         """Select a project as current.
@@ -185,8 +195,12 @@ class ProjectsViewModel(QObject):
         Args:
             profile_id: Profile ID to filter by, or None for all
         """
+        # Re-selecting the same profile (e.g. after the profile list was
+        # rebuilt) would emit an identical project list
+        if profile_id == self._selected_profile_id:
+            return
         self._selected_profile_id = profile_id
-        self._refresh_projects()
+        self._apply_profile_filter()
     
     # Public methods - Todos
     
@@ -207,8 +221,8 @@ class ProjectsViewModel(QObject):
             todo_id: Todo ID
             project_id: Project ID (for refresh)
         """
-        self.repo.delete_project_todo(todo_id)
-        self._load_todos(project_id)
+        if self.repo.delete_project_todo(todo_id):
+            self._load_todos(project_id)
     
     def toggle_todo_completed(self, todo_id: int, completed: bool, project_id: int) -> None:
         """Toggle todo completion state.
@@ -218,8 +232,9 @@ class ProjectsViewModel(QObject):
             completed: New completion state
             project_id: Project ID (for refresh)
         """
-        self.repo.set_project_todo_completed(todo_id, completed)
-        self._load_todos(project_id)
+        # Repeated toggles (e.g. double clicks) leave the todo unchanged
+        if self.repo.set_project_todo_completed(todo_id, completed):
+            self._load_todos(project_id)
     
     def load_todos(self, project_id: int) -> None:
         """Load todos for a project.
@@ -232,24 +247,49 @@ class ProjectsViewModel(QObject):
     # Private methods
     
     def _refresh_projects(self) -> None:
-        """Refresh projects list from database."""
-        if self._selected_profile_id is not None:
-            rows = self.repo.list_projects(profile_id=self._selected_profile_id)
+        """Reload all projects from database and apply the profile filter."""
+        self._all_projects = self.repo.list_projects()
+        self._apply_profile_filter()
+    
+    def _apply_profile_filter(self) -> None:
+        """Show the loaded projects of the selected profile.
+        
+        Filtering happens in memory, so switching the filter does not
+        query the database.
+        """
+        profile_id = self._selected_profile_id
+        if profile_id is None:
+            self._projects = list(self._all_projects)
         else:
-            rows = self.repo.list_projects()
-        self._projects = [dict(row) for row in rows]
+            self._projects = [p for p in self._all_projects if p["profile_id"] == profile_id]
         self.projects_changed.emit(self._projects)
     
+    def _on_profiles_updated(self) -> None:
+        """Handle profile changes; projects show profile names and go with their profile."""
+        self._refresh_profiles()
+        self._refresh_projects()
+    
+    def _on_services_updated(self) -> None:
+        """Handle service changes; projects show service names and rates."""
+        self._refresh_services()
+        self._refresh_projects()
+    
     def _refresh_profiles(self) -> None:
-        """Refresh profiles list from database."""
-        rows = self.repo.list_profiles()
-        self._profiles = [dict(row) for row in rows]
+        """Refresh profiles list from database, unless it is already current."""
+        revision = self.state.revision("profiles_updated")
+        if revision == self._profiles_revision:
+            return
+        self._profiles_revision = revision
+        self._profiles = self.repo.list_profiles()
         self.profiles_changed.emit(self._profiles)
     
     def _refresh_services(self) -> None:
-        """Refresh services list from database."""
-        rows = self.repo.list_services()
-        self._services = [dict(row) for row in rows]
+        """Refresh services list from database, unless it is already current."""
+        revision = self.state.revision("services_updated")
+        if revision == self._services_revision:
+            return
+        self._services_revision = revision
+        self._services = self.repo.list_services()
         self.services_changed.emit(self._services)
     
     def _load_todos(self, project_id: int) -> None:
@@ -258,7 +298,6 @@ class ProjectsViewModel(QObject):
         Args:
             project_id: Project ID
         """
-        rows = self.repo.list_project_todos(project_id)
-        self._todos = [dict(row) for row in rows]
+        self._todos = self.repo.list_project_todos(project_id)
         self.todos_changed.emit(self._todos)
 
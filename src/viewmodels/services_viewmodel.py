@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, List, Optional
 from PySide6.QtCore import QObject, Signal
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from src.services.state_service import StateService
 
 
@@ -18,7 +20,7 @@ class ServicesViewModel(QObject):
     """
     
     # Signals
-    services_changed = Signal(list)  # List of service dicts
+    services_changed = Signal(list)  # List of service rows
     error_occurred = Signal(str, str)  # title, message
     
     def __init__(self, state_service: "StateService") -> None:
@@ -32,7 +34,8 @@ class ServicesViewModel(QObject):
         self.repo = state_service.repository
         
         # Internal state
-        self._services: List[dict] = []
+        self._services: List["sqlite3.Row"] = []
+        self._services_revision: Optional[int] = None  # State revision loaded above
         
         # Connect to state changes
         self.state.services_updated.connect(self._refresh_services)
@@ -43,7 +46,7 @@ class ServicesViewModel(QObject):
     # Properties
     
     @property
-    def services(self) -> List[dict]:
+    def services(self) -> List["sqlite3.Row"]:
         """Get list of all services."""
         return self._services
     
@@ -96,14 +99,14 @@ class ServicesViewModel(QObject):
         self.repo.delete_service(service_id)
         self.state.notify_services_updated()
     
-    def get_service_by_index(self, index: int) -> Optional[dict]:
+    def get_service_by_index(self, index: int) -> Optional["sqlite3.Row"]:
         """Get service by list index.
         
         Args:
             index: Row index
             
         Returns:
-            Service dict or None
+            Service row or None
         """
         if 0 <= index < len(self._services):
             return self._services[index]
@@ -112,8 +115,11 @@ class ServicesViewModel(QObject):
     # Private methods
     
     def _refresh_services(self) -> None:
-        """Refresh services list from database."""
-        rows = self.repo.list_services()
-        self._services = [dict(row) for row in rows]
+        """Refresh services list from database, unless it is already current."""
+        revision = self.state.revision("services_updated")
+        if revision == self._services_revision:
+            return
+        self._services_revision = revision
+        self._services = self.repo.list_services()
         self.services_changed.emit(self._services)
 
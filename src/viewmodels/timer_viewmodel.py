@@ -4,11 +4,13 @@ from __future__ import annotations
 import time
 from typing import TYPE_CHECKING, List, Optional
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 
 from src.utils.formatters import format_duration
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from src.services.state_service import StateService
     from src.services.timer_service import TimerService
 
@@ -18,18 +20,26 @@ class TimerViewModel(QObject):
     
     Manages:
     - Timer start/stop logic
-    - Time entries list
+    - Time entries list (loaded in pages)
     - Progress calculation
     - Entry editing and deletion
     """
     
+    # Number of entries loaded per page
+    ENTRIES_PAGE_SIZE = 200
+    
+    # Elapsed time is shown in whole seconds
+    TICK_INTERVAL_MS = 1000
+    
     # Signals
     timer_state_changed = Signal(bool)  # is_running
     elapsed_updated = Signal(int)  # seconds
     progress_updated = Signal(int, object)  # elapsed_seconds, target_seconds (Optional[int])
-    entries_changed = Signal(list)  # List of entry dicts
-    profiles_changed = Signal(list)  # List of profile dicts
-    projects_changed = Signal(list)  # List of project dicts for selected profile
+    entries_changed = Signal(list)  # List of entry rows (first page)
+    entries_appended = Signal(list)  # Next page of entry rows
+    entries_filter_changed = Signal(object, object)  # profile_id, project_id to show
+    profiles_changed = Signal(list)  # List of profile rows
+    projects_changed = Signal(list)  # List of project rows for selected profile
     
     def __init__(self, state_service: "StateService", timer_service: "TimerService") -> None:
         """Initialize timer ViewModel.
@@ -44,25 +54,43 @@ class TimerViewModel(QObject):
         self.repo = state_service.repository
         
         # Internal state
-        self._entries: List[dict] = []
+        self._entries: List["sqlite3.Row"] = []
+        self._entries_total: int = 0
+        self._entries_scope: tuple = (None, None)  # (profile_id, project_id) entries were loaded with
+        self._entries_stale = True  # Loaded entries no longer match the database
         self._elapsed_seconds: int = 0
+        # ((entry id, start_ts), monotonic time, elapsed seconds at that time) of the running entry
+        self._elapsed_anchor: Optional[tuple[tuple[int, int], float, float]] = None
         self._target_seconds: Optional[int] = None
-        self._profiles: List[dict] = []
-        self._projects: List[dict] = []
+        # (completed seconds, running entry start, target) for the current selection
+        self._progress_baseline: Optional[tuple[int, Optional[int], Optional[int]]] = None
+        self._profiles: List["sqlite3.Row"] = []
+        self._profiles_revision: Optional[int] = None  # State revision of _profiles
+        self._projects: List["sqlite3.Row"] = []
+        self._projects_by_id: dict[int, "sqlite3.Row"] = {}
         self._selected_profile_id: Optional[int] = None
         self._selected_project_id: Optional[int] = None
         
+        # Pending coalesced updates (see _schedule_refresh/_schedule_state_sync)
+        self._refresh_pending = False
+        self._state_sync_pending = False
+        
         # Connect to state changes
         self.state.active_entry_changed.connect(self._on_active_entry_changed)
         self.state.profile_changed.connect(self._on_profile_changed)
-        self.state.entries_updated.connect(self._refresh_entries)
-        self.state.profiles_updated.connect(self._refresh_profiles)
+        self.state.entries_updated.connect(self._on_entries_updated)
+        self.state.profiles_updated.connect(self._on_profiles_updated)
+        self.state.projects_updated.connect(self._on_projects_updated)
         
-        # Update timer for elapsed time
+        # Update timer for elapsed time; only runs while the view is visible
+        # and an entry is active (see _sync_update_timer). It is re-armed on
+        # every tick to fire just after the next whole elapsed second.
+        self._view_visible = False
+        self._next_tick_ms = self.TICK_INTERVAL_MS
         self._update_timer = QTimer(self)
-        self._update_timer.setInterval(500)
-        self._update_timer.timeout.connect(self._update_elapsed)
-        self._update_timer.start()
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setTimerType(Qt.PreciseTimer)
+        self._update_timer.timeout.connect(self._on_tick)
         
         # Initial load
         self._refresh_profiles()
@@ -87,17 +115,17 @@ class TimerViewModel(QObject):
         return self.state.active_entry is not None
     
     @property
-    def entries(self) -> List[dict]:
+    def entries(self) -> List["sqlite3.Row"]:
         """Get list of time entries."""
         return self._entries
     
     @property
-    def profiles(self) -> List[dict]:
+    def profiles(self) -> List["sqlite3.Row"]:
         """Get list of all profiles."""
         return self._profiles
     
     @property
-    def projects(self) -> List[dict]:
+    def projects(self) -> List["sqlite3.Row"]:
         """Get list of projects for selected profile."""
         return self._projects
     
@@ -130,7 +158,7 @@ class TimerViewModel(QObject):
         else:
             self.timer_service.start(profile_id, note=note, project_id=self._selected_project_id)
         
-        self.timer_state_changed.emit(self.is_running)
+        self._schedule_state_sync()
     
     def select_profile(self, profile_id: Optional[int]) -> None:
         """Select a profile for the timer.
@@ -140,10 +168,11 @@ class TimerViewModel(QObject):
         """
         self._selected_profile_id = profile_id
         self._selected_project_id = None  # Clear project selection
+        self._invalidate_progress()
         self._refresh_projects()
         # Update progress and entries to reflect profile's time tracking
         self._update_progress()
-        self._refresh_entries()
+        self._apply_entries_filter()
     
     def select_project(self, project_id: Optional[int]) -> None:
         """Select a project for the timer.
@@ -152,9 +181,19 @@ class TimerViewModel(QObject):
             project_id: Project ID to select, or None
         """
         self._selected_project_id = project_id
+        self._invalidate_progress()
         # Update progress and entries to reflect project's time tracking
         self._update_progress()
-        self._refresh_entries()
+        self._apply_entries_filter()
+    
+    def set_view_visible(self, visible: bool) -> None:
+        """Tell the ViewModel whether the timer view is on screen.
+        
+        Args:
+            visible: True when the view is shown, False when hidden
+        """
+        self._view_visible = visible
+        self._sync_update_timer()
     
     def update_entry_note_tags(self, entry_id: int, note: str, tags: str) -> None:
         """Update an entry's note and tags.
@@ -164,8 +203,10 @@ class TimerViewModel(QObject):
             note: New note text
             tags: New tags (comma-separated)
         """
-        self.repo.update_entry_note_tags(entry_id, note, tags)
-        self.state.notify_entries_updated()
+        with self.state.batch():
+            self.repo.update_entry_note_tags(entry_id, note, tags)
+            self._sync_active_entry()
+            self.state.notify_entries_updated()
 
     def update_entry_timestamps(self, entry_id: int, start_ts: int, end_ts: Optional[int]) -> None:
         """Update an entry's timestamps.
@@ -175,8 +216,10 @@ class TimerViewModel(QObject):
             start_ts: New start timestamp
             end_ts: New end timestamp (can be None)
         """
-        self.repo.update_entry_timestamps(entry_id, start_ts, end_ts)
-        self.state.notify_entries_updated()
+        with self.state.batch():
+            self.repo.update_entry_timestamps(entry_id, start_ts, end_ts)
+            self._sync_active_entry()
+            self.state.notify_entries_updated()
 
     def update_entry_profile_project(self, entry_id: int, profile_name: str, project_name: str) -> None:
         """Update an entry's profile and project by names.
@@ -201,14 +244,20 @@ class TimerViewModel(QObject):
         # Find project by name (only in selected profile's projects)
         project_id = None
         if project_name and project_name != "—":
-            projects = self.repo.list_projects(profile_id=profile_id)
+            # Reuse the loaded project list when editing within the selected profile
+            if profile_id == self._selected_profile_id:
+                projects = self._projects
+            else:
+                projects = self.repo.list_projects(profile_id=profile_id)
             for proj in projects:
                 if proj["name"] == project_name:
                     project_id = int(proj["id"])
                     break
         
-        self.repo.update_entry_profile_project(entry_id, profile_id, project_id)
-        self.state.notify_entries_updated()
+        with self.state.batch():
+            self.repo.update_entry_profile_project(entry_id, profile_id, project_id)
+            self._sync_active_entry()
+            self.state.notify_entries_updated()
     
     def delete_entries(self, entry_ids: List[int]) -> None:
         """Delete multiple entries.
@@ -216,71 +265,198 @@ class TimerViewModel(QObject):
         Args:
             entry_ids: List of entry IDs to delete
         """
-        if len(entry_ids) == 1:
-            self.repo.delete_entry(entry_ids[0])
-        else:
-            self.repo.delete_entries(entry_ids)
-        self.state.notify_entries_updated()
+        with self.state.batch():
+            if len(entry_ids) == 1:
+                self.repo.delete_entry(entry_ids[0])
+            else:
+                self.repo.delete_entries(entry_ids)
+            self._sync_active_entry()
+            self.state.notify_entries_updated()
     
-    def get_entry_by_index(self, index: int) -> Optional[dict]:
-        """Get entry by table row index.
-        
-        Args:
-            index: Row index
-            
-        Returns:
-            Entry dict or None
-        """
-        if 0 <= index < len(self._entries):
-            return self._entries[index]
-        return None
+    def can_fetch_more_entries(self) -> bool:
+        """Check whether more entries exist beyond the loaded pages."""
+        return len(self._entries) < self._entries_total
+    
+    def fetch_more_entries(self) -> None:
+        """Load the next page of entries and emit it."""
+        if not self.can_fetch_more_entries():
+            return
+        profile_id, project_id = self._entries_scope
+        rows = self.repo.list_entries(
+            profile_id=profile_id,
+            project_id=project_id,
+            limit=self.ENTRIES_PAGE_SIZE,
+            offset=len(self._entries),
+        )
+        if not rows:
+            # Rows were deleted underneath us; stop paging
+            self._entries_total = len(self._entries)
+            return
+        self._entries.extend(rows)
+        self.entries_appended.emit(rows)
     
     # Private methods
     
+    def _sync_active_entry(self) -> None:
+        """Reload the cached active entry after an entry write.
+        
+        Edits can change, end or delete the running entry; TimerService
+        decides whether to stop from the cached entry, so it must not go stale.
+        """
+        self.state.refresh_active_entry()
+    
     def _on_active_entry_changed(self, entry: Optional[dict]) -> None:
         """Handle active entry change."""
-        self.timer_state_changed.emit(self.is_running)
-        self._update_elapsed()
+        self._schedule_state_sync()
     
     def _on_profile_changed(self, profile_id: Optional[int]) -> None:
         """Handle profile selection change."""
-        self._refresh_entries()
+        self._schedule_refresh()
+    
+    def _on_entries_updated(self) -> None:
+        """Handle entry changes by reloading the entries."""
+        self._entries_stale = True
+        self._schedule_refresh()
+    
+    def _on_profiles_updated(self) -> None:
+        """Handle profile changes; loaded entries may show outdated names."""
+        self._entries_stale = True
+        self._refresh_profiles()
+    
+    def _on_projects_updated(self) -> None:
+        """Handle project changes; the progress target comes from the project list."""
+        project_id = self._selected_project_id
+        self._invalidate_progress()
+        self._refresh_projects()
+        if self._selected_project_id != project_id:
+            # The selected project was deleted
+            self._apply_entries_filter()
         self._update_progress()
     
+    def _schedule_refresh(self) -> None:
+        """Refresh entries once the current event-loop turn is done.
+        
+        A single user action (e.g. stopping one timer and starting another)
+        fires several change notifications; they collapse into one refresh.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self) -> None:
+        """Run a refresh requested via _schedule_refresh."""
+        self._refresh_pending = False
+        self._refresh_entries()
+    
+    def _schedule_state_sync(self) -> None:
+        """Emit the timer state and elapsed time once per event-loop turn."""
+        if not self._state_sync_pending:
+            self._state_sync_pending = True
+            QTimer.singleShot(0, self._do_state_sync)
+    
+    def _do_state_sync(self) -> None:
+        """Run a state sync requested via _schedule_state_sync."""
+        self._state_sync_pending = False
+        self._invalidate_progress()
+        self.timer_state_changed.emit(self.is_running)
+        self._update_elapsed()
+        self._sync_update_timer()
+    
+    def _should_tick(self) -> bool:
+        """Check whether elapsed time needs updating every second."""
+        return self._view_visible and self.state.active_entry is not None
+    
+    def _sync_update_timer(self) -> None:
+        """Start or stop the elapsed-time timer to match visibility and timer state."""
+        should_run = self._should_tick()
+        if should_run == self._update_timer.isActive():
+            return
+        if should_run:
+            # Catch up right away instead of waiting for the first tick
+            self._update_elapsed()
+            self._update_timer.start(self._next_tick_ms)
+        else:
+            self._update_timer.stop()
+    
+    def _on_tick(self) -> None:
+        """Update elapsed time and arm the timer for the next second."""
+        self._update_elapsed()
+        if self._should_tick() and not self._update_timer.isActive():
+            self._update_timer.start(self._next_tick_ms)
+    
     def _refresh_entries(self) -> None:
-        """Refresh entries list from database."""
+        """Refresh entries list from database, loading only the first page.
+        
+        Entries already loaded for the same selection are reused until the
+        entries or profiles change.
+        """
         # Use selected profile and project for filtering
         # If _selected_profile_id is None, show all entries from all profiles
         profile_id = self._selected_profile_id
         project_id = self._selected_project_id
         
-        print(f"DEBUG: _refresh_entries - profile_id: {profile_id}, project_id: {project_id}")
-        
-        rows = self.repo.list_entries(profile_id=profile_id, project_id=project_id)
-        self._entries = [dict(row) for row in rows]
-        
-        print(f"DEBUG: Found {len(self._entries)} entries")
-        
+        self._invalidate_progress()
+        if not self._entries_stale and self._entries_scope == (profile_id, project_id):
+            self._update_progress()
+            return
+        self._entries_stale = False
+        self._entries_scope = (profile_id, project_id)
+        self._entries_total = self.repo.count_entries(profile_id=profile_id, project_id=project_id)
+        self._entries = self.repo.list_entries(
+            profile_id=profile_id,
+            project_id=project_id,
+            limit=self.ENTRIES_PAGE_SIZE,
+        )
         self.entries_changed.emit(self._entries)
         self._update_progress()
     
+    def _apply_entries_filter(self) -> None:
+        """Show entries for the current selection.
+        
+        When every entry of every profile is already loaded the view just
+        filters them in memory; otherwise the entries are re-queried.
+        """
+        self.entries_filter_changed.emit(self._selected_profile_id, self._selected_project_id)
+        if self._entries_scope == (None, None) and not self.can_fetch_more_entries():
+            return
+        self._schedule_refresh()
+    
     def _update_elapsed(self) -> None:
         """Update elapsed time for active entry."""
         active = self.state.active_entry
         if not active:
+            self._elapsed_anchor = None
             self._elapsed_seconds = 0
+            self._next_tick_ms = self.TICK_INTERVAL_MS
             self.elapsed_updated.emit(0)
             self._update_progress()
             return
         
-        start_s = int(active["start_ts"])
-        dur = int(time.time()) - start_s
+        # Wall clock is read once per entry; ticks then advance on the
+        # monotonic clock so clock adjustments don't make the timer jump
+        mono = time.monotonic()
+        key = (int(active["id"]), int(active["start_ts"]))
+        if self._elapsed_anchor is None or self._elapsed_anchor[0] != key:
+            self._elapsed_anchor = (key, mono, time.time() - key[1])
+        _, mono_start, elapsed_start = self._elapsed_anchor
+        elapsed = elapsed_start + (mono - mono_start)
+        dur = int(elapsed)
+        # Land a few milliseconds past the boundary so no second is skipped
+        self._next_tick_ms = int((dur + 1 - elapsed) * 1000) + 5
         self._elapsed_seconds = dur
         self.elapsed_updated.emit(dur)
-        self._update_progress()
+        # Same clock as the label, so the ring and the label agree
+        self._update_progress(key[1] + dur)
     
-    def _update_progress(self) -> None:
-        """Update progress calculation."""
+    def _update_progress(self, now: Optional[int] = None) -> None:
+        """Update progress calculation.
+        
+        Completed time and target come from a cached baseline; only the
+        running entry's share is recomputed on each tick.
+        
+        Args:
+            now: Current timestamp as derived by the caller (defaults to time.time())
+        """
         profile_id = self._selected_profile_id
         project_id = self._selected_project_id
         
@@ -290,59 +466,84 @@ class TimerViewModel(QObject):
             self.progress_updated.emit(0, None)
             return
         
-        # If a project is selected, track project time
-        if project_id is not None:
-            elapsed = self._compute_elapsed_total_seconds(profile_id, project_id)
+        if now is None:
+            now = int(time.time())
+        if self._progress_baseline is None:
+            self._progress_baseline = self._compute_progress_baseline(profile_id, project_id, now)
+        completed, running_start, target = self._progress_baseline
+        
+        elapsed = completed
+        if running_start is not None:
+            elapsed += max(0, now - running_start)
+        
+        self._target_seconds = target
+        self.progress_updated.emit(elapsed, target)
+    
+    def _invalidate_progress(self) -> None:
+        """Drop the cached progress baseline so the next update re-queries it."""
+        self._progress_baseline = None
+    
+    def _compute_progress_baseline(
+        self, profile_id: int, project_id: Optional[int], now: int
+    ) -> tuple[int, Optional[int], Optional[int]]:
+        """Query the progress values that don't change while the timer runs.
+        
+        Args:
+            profile_id: Selected profile ID
+            project_id: Selected project ID or None
+            now: Current timestamp
             
-            # Get project's estimated time as target
-            target: Optional[int] = None
-            proj = self.repo.get_project(project_id)
+        Returns:
+            Tuple of (completed seconds, running entry start or None, target seconds or None)
+        """
+        total = self._compute_elapsed_total_seconds(profile_id, project_id, now)
+        
+        # Split off the running entry so it can advance without the database
+        running_start: Optional[int] = None
+        active = self.state.active_entry
+        if (
+            active
+            and int(active["profile_id"]) == profile_id
+            and (project_id is None or active["project_id"] == project_id)
+        ):
+            running_start = int(active["start_ts"])
+            total -= max(0, now - running_start)
+        
+        # Profiles no longer have time targets - only projects do
+        target: Optional[int] = None
+        if project_id is not None:
+            proj = self._projects_by_id.get(project_id) or self.repo.get_project(project_id)
             if proj and proj["estimated_seconds"] is not None:
                 target = int(proj["estimated_seconds"])
-            
-            self._target_seconds = target
-            self.progress_updated.emit(elapsed, target)
-        else:
-            # Otherwise, track profile time without a target
-            elapsed = self._compute_elapsed_total_seconds(profile_id, None)
-            
-            # Profiles no longer have time targets - only projects do
-            target: Optional[int] = None
-            
-            self._target_seconds = target
-            self.progress_updated.emit(elapsed, target)
+        
+        return total, running_start, target
     
-    def _compute_elapsed_total_seconds(self, profile_id: Optional[int], project_id: Optional[int] = None) -> int:
-        """Compute total elapsed seconds for a profile or project today.
+    def _compute_elapsed_total_seconds(
+        self, profile_id: Optional[int], project_id: Optional[int] = None, now: Optional[int] = None
+    ) -> int:
+        """Compute total elapsed seconds for a profile or project.
         
         Args:
             profile_id: Profile ID
             project_id: Optional project ID to filter by
+            now: Current timestamp (defaults to time.time())
             
         Returns:
             Total elapsed seconds
         """
         if profile_id is None:
             return 0
-        
-        now = int(time.time())
-        total = 0
-        rows = self.repo.list_entries(profile_id=profile_id, project_id=project_id)
-        
-        for r in rows:
-            start_ts = int(r["start_ts"]) if r["start_ts"] is not None else None
-            end_ts = int(r["end_ts"]) if r["end_ts"] is not None else now
-            if start_ts is None:
-                continue
-            if end_ts > start_ts:
-                total += end_ts - start_ts
-        
-        return total
+        if now is None:
+            now = int(time.time())
+        return self.repo.sum_elapsed_between(profile_id, 0, now, project_id=project_id)
     
     def _refresh_profiles(self) -> None:
-        """Refresh profiles list from database."""
-        rows = self.repo.list_profiles()
-        self._profiles = [dict(row) for row in rows]
+        """Refresh profiles list from database, unless it is already current."""
+        revision = self.state.revision("profiles_updated")
+        if revision == self._profiles_revision:
+            return
+        self._profiles_revision = revision
+        self._profiles = self.repo.list_profiles()
         self.profiles_changed.emit(self._profiles)
     
     def _refresh_projects(self) -> None:
@@ -350,7 +551,10 @@ class TimerViewModel(QObject):
         if self._selected_profile_id is None:
             self._projects = []
         else:
-            rows = self.repo.list_projects(profile_id=self._selected_profile_id)
-            self._projects = [dict(row) for row in rows]
+            self._projects = self.repo.list_projects(profile_id=self._selected_profile_id)
+        self._projects_by_id = {int(p["id"]): p for p in self._projects}
+        # A deleted project can no longer stay selected
+        if self._selected_project_id not in self._projects_by_id:
+            self._selected_project_id = None
         self.projects_changed.emit(self._projects)
 
@@ -2,10 +2,53 @@
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
 from PySide6.QtCore import QObject, Signal
 
 
+# Parsing and formatting are cached; typing and toggling the rate repeat
+# the same inputs and values
+@lru_cache(maxsize=256)
+def _parse_value(value: str) -> Decimal:
+    """Parse a string value to Decimal, handling German number format.
+    
+    Args:
+        value: String value (may use comma as decimal separator)
+        
+    Returns:
+        Parsed Decimal value, or 0 if invalid.
+    """
+    if not value or not value.strip():
+        return Decimal("0")
+    
+    # Replace comma with dot for German format
+    cleaned = value.strip().replace(",", ".")
+    
+    try:
+        return Decimal(cleaned)
+    except InvalidOperation:
+        return Decimal("0")
+
+
+@lru_cache(maxsize=256)
+def _format_value(value: Decimal) -> str:
+    """Format a Decimal value to German number format.
+    
+    Args:
+        value: Decimal value to format
+        
+    Returns:
+        Formatted string with comma as decimal separator.
+    """
+    # Round to 2 decimal places and format with comma
+    rounded = value.quantize(Decimal("0.01"))
+    # -0 and 0 are the same cache key; always show zero unsigned
+    if not rounded:
+        rounded = abs(rounded)
+    return str(rounded).replace(".", ",")
+
+
 class VatCalculatorViewModel(QObject):
     """ViewModel for the VAT calculator view.
     
@@ -25,6 +68,9 @@ class VatCalculatorViewModel(QObject):
         self._mwst = Decimal("0")
         self._brutto = Decimal("0")
         self._vat_rate = Decimal("19")  # Default 19%
+        # Derived from the rate; only recomputed when the rate changes
+        self._rate_decimal = self._vat_rate / Decimal("100")
+        self._brutto_divisor = Decimal("1") + self._rate_decimal
     
     @property
     def vat_rate(self) -> Decimal:
@@ -35,9 +81,11 @@ class VatCalculatorViewModel(QObject):
     def vat_rate(self, value: Decimal) -> None:
         """Set VAT rate and recalculate from current netto."""
         self._vat_rate = value
+        self._rate_decimal = value / Decimal("100")
+        self._brutto_divisor = Decimal("1") + self._rate_decimal
         # Recalculate based on current netto value
         if self._netto > 0:
-            self.calculate_from_netto(self._format_value(self._netto))
+            self.calculate_from_netto(_format_value(self._netto))
     
     def toggle_vat_rate(self) -> Decimal:
         """Toggle between 19% and 7% VAT rates.
@@ -51,45 +99,12 @@ class VatCalculatorViewModel(QObject):
             self.vat_rate = Decimal("19")
         return self._vat_rate
     
-    def _parse_value(self, value: str) -> Decimal:
-        """Parse a string value to Decimal, handling German number format.
-        
-        Args:
-            value: String value (may use comma as decimal separator)
-            
-        Returns:
-            Parsed Decimal value, or 0 if invalid.
-        """
-        if not value or not value.strip():
-            return Decimal("0")
-        
-        # Replace comma with dot for German format
-        cleaned = value.strip().replace(",", ".")
-        
-        try:
-            return Decimal(cleaned)
-        except InvalidOperation:
-            return Decimal("0")
-    
-    def _format_value(self, value: Decimal) -> str:
-        """Format a Decimal value to German number format.
-        
-        Args:
-            value: Decimal value to format
-            
-        Returns:
-            Formatted string with comma as decimal separator.
-        """
-        # Round to 2 decimal places and format with comma
-        rounded = value.quantize(Decimal("0.01"))
-        return str(rounded).replace(".", ",")
-    
     def _emit_values(self) -> None:
         """Emit current values as formatted strings."""
         self.values_changed.emit(
-            self._format_value(self._netto),
-            self._format_value(self._mwst),
-            self._format_value(self._brutto)
+            _format_value(self._netto),
+            _format_value(self._mwst),
+            _format_value(self._brutto)
         )
     
     def calculate_from_netto(self, netto_str: str) -> None:
@@ -98,10 +113,9 @@ class VatCalculatorViewModel(QObject):
         Args:
             netto_str: Netto value as string
         """
-        self._netto = self._parse_value(netto_str)
-        rate_decimal = self._vat_rate / Decimal("100")
+        self._netto = _parse_value(netto_str)
         
-        self._mwst = self._netto * rate_decimal
+        self._mwst = self._netto * self._rate_decimal
         self._brutto = self._netto + self._mwst
         
         self._emit_values()
@@ -112,11 +126,10 @@ class VatCalculatorViewModel(QObject):
         Args:
             mwst_str: MwSt value as string
         """
-        self._mwst = self._parse_value(mwst_str)
-        rate_decimal = self._vat_rate / Decimal("100")
+        self._mwst = _parse_value(mwst_str)
         
-        if rate_decimal > 0:
-            self._netto = self._mwst / rate_decimal
+        if self._rate_decimal > 0:
+            self._netto = self._mwst / self._rate_decimal
         else:
             self._netto = Decimal("0")
         
@@ -130,11 +143,9 @@ class VatCalculatorViewModel(QObject):
         Args:
             brutto_str: Brutto value as string
         """
-        self._brutto = self._parse_value(brutto_str)
-        rate_decimal = self._vat_rate / Decimal("100")
+        self._brutto = _parse_value(brutto_str)
         
-        divisor = Decimal("1") + rate_decimal
-        self._netto = self._brutto / divisor
+        self._netto = self._brutto / self._brutto_divisor
         self._mwst = self._brutto - self._netto
         
         self._emit_values()
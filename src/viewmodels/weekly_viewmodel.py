@@ -3,9 +3,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from src.services.state_service import StateService
 
 
@@ -18,7 +20,7 @@ class WeeklyViewModel(QObject):
     """
     
     # Signals
-    weeks_changed = Signal(list)  # List of week summary dicts
+    weeks_changed = Signal(list)  # List of week summary rows
     
     def __init__(self, state_service: "StateService") -> None:
         """Initialize weekly ViewModel.
@@ -31,10 +33,11 @@ class WeeklyViewModel(QObject):
         self.repo = state_service.repository
         
         # Internal state
-        self._weeks: List[dict] = []
+        self._weeks: List["sqlite3.Row"] = []
+        self._refresh_pending = False
         
         # Connect to state changes
-        self.state.entries_updated.connect(self._refresh_weeks)
+        self.state.entries_updated.connect(self._schedule_refresh)
         
         # Initial load
         self._refresh_weeks()
@@ -42,15 +45,29 @@ class WeeklyViewModel(QObject):
     # Properties
     
     @property
-    def weeks(self) -> List[dict]:
+    def weeks(self) -> List["sqlite3.Row"]:
         """Get list of weekly summaries."""
         return self._weeks
     
     # Private methods
     
+    def _schedule_refresh(self) -> None:
+        """Refresh weeks once the current event-loop turn is done.
+        
+        Edits that report several entry changes in a row collapse into a
+        single aggregation query.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self) -> None:
+        """Run a refresh requested via _schedule_refresh."""
+        self._refresh_pending = False
+        self._refresh_weeks()
+    
     def _refresh_weeks(self) -> None:
         """Refresh weeks list from database."""
-        rows = self.repo.get_weekly_summary()
-        self._weeks = [dict(row) for row in rows]
+        self._weeks = self.repo.get_weekly_summary()
         self.weeks_changed.emit(self._weeks)
 
@@ -1,6 +1,7 @@
 """Dashboard view with navigation tiles."""
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt
@@ -12,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.ui.components import TileButton
+from src.viewmodels import NavTarget
 
 if TYPE_CHECKING:
     from src.viewmodels import DashboardViewModel
@@ -58,37 +60,37 @@ class DashboardView(QWidget):
         
         # Timer tile
         self.timer_tile = TileButton("Timer", "⏱️")
-        self.timer_tile.set_click_callback(self.viewmodel.request_navigate_to_timer)
+        self.timer_tile.set_click_callback(partial(self.viewmodel.request_navigate, NavTarget.TIMER))
         tiles_layout.addWidget(self.timer_tile, 0, 0)
         
         # Profiles tile
         self.profiles_tile = TileButton("Profiles", "👥")
-        self.profiles_tile.set_click_callback(self.viewmodel.request_navigate_to_profiles)
+        self.profiles_tile.set_click_callback(partial(self.viewmodel.request_navigate, NavTarget.PROFILES))
         tiles_layout.addWidget(self.profiles_tile, 0, 1)
         
         # Projects tile
         self.projects_tile = TileButton("Projects", "📋")
-        self.projects_tile.set_click_callback(self.viewmodel.request_navigate_to_projects)
+        self.projects_tile.set_click_callback(partial(self.viewmodel.request_navigate, NavTarget.PROJECTS))
         tiles_layout.addWidget(self.projects_tile, 1, 0)
         
         # Services tile
         self.services_tile = TileButton("Services", "💼")
-        self.services_tile.set_click_callback(self.viewmodel.request_navigate_to_services)
+        self.services_tile.set_click_callback(partial(self.viewmodel.request_navigate, NavTarget.SERVICES))
         tiles_layout.addWidget(self.services_tile, 1, 1)
         
         # Weekly tile
         self.weekly_tile = TileButton("Weekly", "📅")
-        self.weekly_tile.set_click_callback(self.viewmodel.request_navigate_to_weekly)
+        self.weekly_tile.set_click_callback(partial(self.viewmodel.request_navigate, NavTarget.WEEKLY))
         tiles_layout.addWidget(self.weekly_tile, 2, 0)
         
         # Invoices tile
         self.invoices_tile = TileButton("Invoices", "📄")
-        self.invoices_tile.set_click_callback(self.viewmodel.request_navigate_to_invoices)
+        self.invoices_tile.set_click_callback(partial(self.viewmodel.request_navigate, NavTarget.INVOICES))
         tiles_layout.addWidget(self.invoices_tile, 2, 1)
         
         # Mehrwertsteuer Calculator tile
         self.vat_tile = TileButton("MwSt Calculator", "🧮")
-        self.vat_tile.set_click_callback(self.viewmodel.request_navigate_to_vat_calculator)
+        self.vat_tile.set_click_callback(partial(self.viewmodel.request_navigate, NavTarget.VAT_CALCULATOR))
         tiles_layout.addWidget(self.vat_tile, 3, 0)
         
         layout.addWidget(tiles_container)
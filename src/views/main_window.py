@@ -1,19 +1,18 @@
 """Main window - container for all views."""
 from __future__ import annotations
 
-import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import QByteArray, Qt
-from PySide6.QtGui import QAction, QIcon, QKeySequence
+from PySide6.QtCore import QByteArray, QEvent, QSignalBlocker, Qt, QTimer
+from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QApplication,
+    QDialog,
     QFileDialog,
     QHBoxLayout,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMenu,
     QMessageBox,
@@ -27,6 +26,10 @@ from PySide6.QtWidgets import (
 
 from src.services.export_service import export_csv, export_json
 from src.services.settings_service import AppSettings
+from src.ui.dialogs import ProfileDialog
+from src.ui.icons import app_icon
+from src.ui.list_items import set_id_items
+from src.viewmodels import NavTarget
 from src.views import DashboardView, InvoicesView, ProfilesView, ProjectsView, ServicesView, TimerView, VatCalculatorView, WeeklyView
 
 if TYPE_CHECKING:
@@ -95,6 +98,9 @@ class MainWindow(QMainWindow):
         self.invoices_vm = invoices_vm
         self.vat_calculator_vm = vat_calculator_vm
         
+        # Created in _setup_tray
+        self.tray: Optional[QSystemTrayIcon] = None
+        
         # Setup window
         self.setWindowTitle("SoliaTime")
         self._set_window_icon()
@@ -103,7 +109,8 @@ class MainWindow(QMainWindow):
         self._build_ui()
         self._connect_signals()
         self._setup_menu_bar()
-        self._setup_tray()
+        # The tray icon isn't needed for the first paint; create it once the event loop runs
+        QTimer.singleShot(0, self._setup_tray)
         
         # Restore window state
         settings = self.state.settings
@@ -122,19 +129,9 @@ class MainWindow(QMainWindow):
 
     def _set_window_icon(self) -> None:
         """Set window icon from resources."""
-        try:
-            base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent))
-            candidates = [
-                base / "ui" / "resources" / "App.ico",
-                base / "ui" / "resources" / "app.ico",
-                base / "ui" / "resources" / "App.png",
-            ]
-            for p in candidates:
-                if p.exists():
-                    self.setWindowIcon(QIcon(str(p)))
-                    break
-        except Exception:
-            pass
+        icon = app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
     def _build_ui(self) -> None:
         """Build the UI structure."""
@@ -217,6 +214,17 @@ class MainWindow(QMainWindow):
         self.stack.addWidget(self.invoices_view)
         self.stack.addWidget(self.vat_calculator_view)
         
+        # Pages reachable from the dashboard
+        self._nav_pages = {
+            NavTarget.TIMER: self.timer_view,
+            NavTarget.PROFILES: self.profiles_view,
+            NavTarget.PROJECTS: self.projects_view,
+            NavTarget.SERVICES: self.services_view,
+            NavTarget.WEEKLY: self.weekly_view,
+            NavTarget.INVOICES: self.invoices_view,
+            NavTarget.VAT_CALCULATOR: self.vat_calculator_view,
+        }
+        
         content_layout.addWidget(self.profiles_sidebar, 1)
         content_layout.addWidget(self.stack, 3)
         main_layout.addLayout(content_layout)
@@ -248,13 +256,7 @@ class MainWindow(QMainWindow):
     def _connect_signals(self) -> None:
         """Connect signals between ViewModels and UI."""
         # Dashboard navigation
-        self.dashboard_vm.navigate_to_timer.connect(lambda: self.stack.setCurrentIndex(1))
-        self.dashboard_vm.navigate_to_profiles.connect(lambda: self.stack.setCurrentIndex(2))
-        self.dashboard_vm.navigate_to_projects.connect(lambda: self.stack.setCurrentIndex(3))
-        self.dashboard_vm.navigate_to_services.connect(lambda: self.stack.setCurrentIndex(4))
-        self.dashboard_vm.navigate_to_weekly.connect(lambda: self.stack.setCurrentIndex(5))
-        self.dashboard_vm.navigate_to_invoices.connect(lambda: self.stack.setCurrentIndex(6))
-        self.dashboard_vm.navigate_to_vat_calculator.connect(lambda: self.stack.setCurrentIndex(7))
+        self.dashboard_vm.navigate_requested.connect(self._on_navigate_requested)
         
         # Profiles to Projects navigation
         self.profiles_vm.navigate_to_project_requested.connect(self._navigate_to_project)
@@ -268,6 +270,11 @@ class MainWindow(QMainWindow):
         self.state.profiles_updated.connect(self._populate_sidebar_profiles)
         self.state.active_entry_changed.connect(self._update_tray_tooltip)
         
+        # Pause elapsed-time updates while the application is hidden
+        app = QApplication.instance()
+        if app:
+            app.applicationStateChanged.connect(lambda _state: self._sync_timer_view_visible())
+        
         # Keyboard shortcuts
         toggle_action = QAction("Toggle Timer", self, shortcut=QKeySequence(Qt.Key_Space))
         toggle_action.triggered.connect(self._on_shortcut_toggle_timer)
@@ -297,25 +304,12 @@ class MainWindow(QMainWindow):
         self.tray = QSystemTrayIcon(self)
         
         # Set icon
-        try:
-            base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent))
-            candidates = [
-                base / "ui" / "resources" / "App.ico",
-                base / "ui" / "resources" / "app.ico",
-                base / "ui" / "resources" / "App.png",
-            ]
-            icon_found = False
-            for p in candidates:
-                if p.exists():
-                    self.tray.setIcon(QIcon(str(p)))
-                    icon_found = True
-                    break
-            if not icon_found:
-                self.tray.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
-        except Exception:
-            self.tray.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
-        
-        self.tray.setToolTip("Stopped")
+        icon = app_icon()
+        if icon.isNull():
+            icon = self.style().standardIcon(QStyle.SP_ComputerIcon)
+        self.tray.setIcon(icon)
+        
+        self._update_tray_tooltip(self.state.active_entry)
         
         # Context menu
         menu = QMenu()
@@ -336,6 +330,14 @@ class MainWindow(QMainWindow):
         """Navigate to dashboard."""
         self.stack.setCurrentIndex(0)
     
+    def _on_navigate_requested(self, target: NavTarget) -> None:
+        """Show the page requested from the dashboard.
+        
+        Args:
+            target: Page to show
+        """
+        self.stack.setCurrentWidget(self._nav_pages[target])
+    
     def _navigate_to_project(self, project_id: int) -> None:
         """Navigate to projects view and select specific project.
         
@@ -360,28 +362,28 @@ class MainWindow(QMainWindow):
     
     def _populate_sidebar_profiles(self) -> None:
         """Populate sidebar profiles list."""
-        self.profiles_list.clear()
-        for prof in self.profiles_vm.profiles:
-            it = QListWidgetItem(str(prof["name"]))
-            it.setData(Qt.UserRole, int(prof["id"]))
-            self.profiles_list.addItem(it)
-        
-        # Auto-select based on state
+        # Rebuild and restore the selection with signals blocked, then run
+        # the selection handler exactly once for the final state
         current_id = self.state.current_profile_id
-        if current_id is not None:
-            for i in range(self.profiles_list.count()):
-                item = self.profiles_list.item(i)
-                if item and int(item.data(Qt.UserRole)) == current_id:
-                    self.profiles_list.setCurrentItem(item)
-                    break
-        elif self.profiles_list.count() > 0:
-            self.profiles_list.setCurrentRow(0)
+        self.profiles_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.profiles_list):
+                items = [(int(prof["id"]), str(prof["name"])) for prof in self.profiles_vm.profiles]
+                rows = set_id_items(self.profiles_list, items)
+                current_row = rows.get(current_id) if current_id is not None else None
+                
+                # Auto-select based on state
+                if current_row is not None:
+                    self.profiles_list.setCurrentRow(current_row)
+                elif current_id is None and self.profiles_list.count() > 0:
+                    self.profiles_list.setCurrentRow(0)
+        finally:
+            self.profiles_list.setUpdatesEnabled(True)
+        
+        self._on_sidebar_profile_selected()
 
     def _on_sidebar_add_profile(self) -> None:
         """Handle add profile from sidebar."""
-        from src.ui.dialogs import ProfileDialog
-        from PySide6.QtWidgets import QDialog
-        
         dlg = ProfileDialog(self, title="Create Profile")
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
@@ -497,7 +499,7 @@ class MainWindow(QMainWindow):
         Args:
             entry: Active entry or None
         """
-        if hasattr(self, "tray") and self.tray:
+        if self.tray:
             self.tray.setToolTip("Running" if entry else "Stopped")
 
     def _on_quit_requested(self) -> None:
@@ -510,7 +512,7 @@ class MainWindow(QMainWindow):
                 return
         
         # Clean shutdown
-        if hasattr(self, "tray") and self.tray:
+        if self.tray:
             self.tray.setVisible(False)
             self.tray.deleteLater()
         
@@ -550,6 +552,24 @@ class MainWindow(QMainWindow):
             max(g.top(), g.center().y() - self.height() // 2),
         )
 
+    def _sync_timer_view_visible(self) -> None:
+        """Tell the timer whether its view can actually be seen."""
+        app = QApplication.instance()
+        app_hidden = app is not None and app.applicationState() == Qt.ApplicationHidden
+        self.timer_vm.set_view_visible(
+            self.timer_view.isVisible() and not self.isMinimized() and not app_hidden
+        )
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        """Handle window state changes to pause updates while minimized.
+        
+        Args:
+            event: Change event
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._sync_timer_view_visible()
+
     def closeEvent(self, event) -> None:  # type: ignore[override]
         """Handle window close event.
         
@@ -561,6 +581,7 @@ class MainWindow(QMainWindow):
         settings.geometry = bytes(self.saveGeometry())
         settings.window_state = bytes(self.saveState())
         self.state.update_settings(settings)
+        self.state.flush_settings()
         
         # Prompt if timer running
         if self.timer_service.get_active_entry() is not None:
@@ -574,7 +595,7 @@ class MainWindow(QMainWindow):
                 return
         
         # Clean up
-        if hasattr(self, "tray") and self.tray:
+        if self.tray:
             self.tray.setVisible(False)
             self.tray.deleteLater()
         
@@ -26,6 +26,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.ui.dialogs import ProfileDialog
+from src.ui.list_items import set_id_items
 
 if TYPE_CHECKING:
     from src.viewmodels import ProfilesViewModel
@@ -346,11 +347,15 @@ class ProfilesView(QWidget):
         Args:
             profiles: List of profile dicts
         """
-        self.profiles_list.clear()
-        for prof in profiles:
-            it = QListWidgetItem(str(prof["name"]))
-            it.setData(Qt.UserRole, int(prof["id"]))
-            self.profiles_list.addItem(it)
+        # Rebuild in one pass; clearing the selection is a no-op for the
+        # selection handler, so its signals can be blocked meanwhile
+        self.profiles_list.setUpdatesEnabled(False)
+        self.profiles_list.blockSignals(True)
+        try:
+            set_id_items(self.profiles_list, [(int(prof["id"]), str(prof["name"])) for prof in profiles])
+        finally:
+            self.profiles_list.blockSignals(False)
+            self.profiles_list.setUpdatesEnabled(True)
     
     def _update_projects_list(self, projects: list) -> None:
         """Update projects list with new data.
@@ -25,6 +25,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.ui.dialogs.project_dialog import ProjectDialog
+from src.ui.list_items import set_id_items
 
 if TYPE_CHECKING:
     from src.viewmodels.projects_viewmodel import ProjectsViewModel
@@ -471,11 +472,14 @@ class ProjectsView(QWidget):
         Args:
             profiles: List of profile dicts
         """
-        self.profiles_list.clear()
-        for prof in profiles:
-            it = QListWidgetItem(str(prof["name"]))
-            it.setData(Qt.UserRole, int(prof["id"]))
-            self.profiles_list.addItem(it)
+        # Repaint once after the rebuild. Signals stay connected: when the
+        # list is rebuilt, clearing the selection must still reset the
+        # profile filter.
+        self.profiles_list.setUpdatesEnabled(False)
+        try:
+            set_id_items(self.profiles_list, [(int(prof["id"]), str(prof["name"])) for prof in profiles])
+        finally:
+            self.profiles_list.setUpdatesEnabled(True)
     
     def _update_projects_list(self, projects: list) -> None:
         """Update projects list with new data.
@@ -151,22 +151,25 @@ class ServicesView(QWidget):
         Args:
             services: List of service dicts
         """
-        self.table.setRowCount(0)
-        
-        for service in services:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            name = str(service["name"])
-            rate_cents = int(service["rate_cents"])
-            est_seconds = int(service["estimated_seconds"]) if service["estimated_seconds"] is not None else None
-            
-            self.table.setItem(row, 0, QTableWidgetItem(name))
-            self.table.setItem(row, 1, QTableWidgetItem(format_rate(rate_cents)))
+        # Size the table once and fill cells in place instead of inserting row by row
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(0)
+            self.table.setRowCount(len(services))
             
-            if est_seconds and est_seconds > 0:
-                est_text = format_time_hhmm(est_seconds)
-            else:
-                est_text = "—"
-            self.table.setItem(row, 2, QTableWidgetItem(est_text))
+            for row, service in enumerate(services):
+                name = str(service["name"])
+                rate_cents = int(service["rate_cents"])
+                est_seconds = int(service["estimated_seconds"]) if service["estimated_seconds"] is not None else None
+                
+                self.table.setItem(row, 0, QTableWidgetItem(name))
+                self.table.setItem(row, 1, QTableWidgetItem(format_rate(rate_cents)))
+                
+                if est_seconds and est_seconds > 0:
+                    est_text = format_time_hhmm(est_seconds)
+                else:
+                    est_text = "—"
+                self.table.setItem(row, 2, QTableWidgetItem(est_text))
+        finally:
+            self.table.setUpdatesEnabled(True)
 
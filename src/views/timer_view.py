@@ -1,12 +1,12 @@
 """Timer view with controls and entries table."""
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QDialog,
     QHeaderView,
@@ -16,14 +16,14 @@ from PySide6.QtWidgets import (
     QMenu,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from src.ui.components import CircularProgress
-from src.utils.formatters import format_duration, format_timestamp, parse_timestamp
+from src.ui.models import EntriesFilterProxyModel, EntriesModel
+from src.utils.formatters import format_duration, parse_timestamp
 
 if TYPE_CHECKING:
     from src.viewmodels import TimerViewModel
@@ -44,6 +44,8 @@ class TimerView(QWidget):
         """
         super().__init__(parent)
         self.viewmodel = viewmodel
+        self._last_elapsed_seconds: int | None = None
+        self._last_et_text = ""
         self._build_ui()
         self._connect_signals()
     
@@ -65,10 +67,7 @@ class TimerView(QWidget):
         # Find and select the saved profile (or default to "All profiles")
         profile_index = 0  # Default to "All profiles"
         if saved_profile_id is not None:
-            for i in range(self.profile_combo.count()):
-                if self.profile_combo.itemData(i) == saved_profile_id:
-                    profile_index = i
-                    break
+            profile_index = max(0, self.profile_combo.findData(saved_profile_id))
         
         # Block signals to prevent saving while we're loading
         self.profile_combo.blockSignals(True)
@@ -83,10 +82,7 @@ class TimerView(QWidget):
         # Find and select the saved project (or default to "All projects")
         project_index = 0  # Default to "All projects"
         if saved_project_id is not None and saved_profile_id is not None:
-            for i in range(self.project_combo.count()):
-                if self.project_combo.itemData(i) == saved_project_id:
-                    project_index = i
-                    break
+            project_index = max(0, self.project_combo.findData(saved_project_id))
         
         self.project_combo.setCurrentIndex(project_index)
         self.viewmodel.select_project(saved_project_id if saved_profile_id is not None else None)
@@ -94,6 +90,17 @@ class TimerView(QWidget):
         # Re-enable signals
         self.profile_combo.blockSignals(False)
         self.project_combo.blockSignals(False)
+        
+        self.viewmodel.set_view_visible(True)
+    
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        """Handle hide event to pause elapsed time updates.
+        
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        self.viewmodel.set_view_visible(False)
 
     def _build_ui(self) -> None:
         """Build the UI components."""
@@ -131,17 +138,24 @@ class TimerView(QWidget):
         
         layout.addLayout(selection_row)
         
-        # Entries table
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["Profile", "Project", "Start", "End", "Duration", "Note"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.DoubleClicked | QTableWidget.EditTrigger.EditKeyPressed)
-        
-        # Context menu
-        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.table.customContextMenuRequested.connect(self._show_context_menu)
+        # Entries table: rows are fetched page by page as the user scrolls,
+        # the proxy filters them by profile/project without re-querying
+        self.entries_model = EntriesModel(self.viewmodel, self)
+        self.entries_proxy = EntriesFilterProxyModel(self)
+        self.entries_proxy.setSourceModel(self.entries_model)
+        self.table = QTableView()
+        self.table.setModel(self.entries_proxy)
+        self.table.verticalHeader().setVisible(False)
+        # Timestamps and durations have a fixed width; text columns share the rest
+        header = self.table.horizontalHeader()
+        header.setDefaultSectionSize(150)
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        for col in (2, 3, EntriesModel.DURATION_COLUMN):
+            header.setSectionResizeMode(col, QHeaderView.Fixed)
+        header.resizeSection(EntriesModel.DURATION_COLUMN, 90)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.EditKeyPressed)
         
         # Delete shortcut
         delete_action = QAction("Delete Selected", self, shortcut=QKeySequence(Qt.Key_Delete))
@@ -149,6 +163,12 @@ class TimerView(QWidget):
         delete_action.triggered.connect(self._on_delete_selected)
         self.table.addAction(delete_action)
         
+        # Context menu (built once, reusing the shortcut action)
+        self._ctx_menu = QMenu(self.table)
+        self._ctx_menu.addAction(delete_action)
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._show_context_menu)
+        
         layout.addLayout(top)
         layout.addWidget(self.table, 1)
 
@@ -158,13 +178,14 @@ class TimerView(QWidget):
         self.profile_combo.currentIndexChanged.connect(self._on_profile_selected)
         self.project_combo.currentIndexChanged.connect(self._on_project_selected)
         self.toggle_btn.clicked.connect(self._on_toggle_clicked)
-        self.table.itemChanged.connect(self._on_cell_changed)
+        # Queued so the model is not reset while the editor is still committing
+        self.entries_model.cell_edited.connect(self._on_cell_changed, Qt.QueuedConnection)
         
         # ViewModel → UI
         self.viewmodel.timer_state_changed.connect(self._update_timer_state)
         self.viewmodel.elapsed_updated.connect(self._update_elapsed)
         self.viewmodel.progress_updated.connect(self._update_progress)
-        self.viewmodel.entries_changed.connect(self._update_entries_table)
+        self.viewmodel.entries_filter_changed.connect(self.entries_proxy.set_filter)
         self.viewmodel.profiles_changed.connect(self._update_profiles_combo)
         self.viewmodel.projects_changed.connect(self._update_projects_combo)
         
@@ -209,34 +230,29 @@ class TimerView(QWidget):
         if not self.viewmodel.is_running:
             self.note_edit.clear()
     
-    def _on_cell_changed(self, item: QTableWidgetItem) -> None:
+    def _on_cell_changed(self, row: int, col: int, new_value: str) -> None:
         """Handle cell edit to update entry.
         
         Args:
-            item: The edited table item
+            row: Edited row
+            col: Edited column
+            new_value: New cell text
         """
-        if not item:
-            return
-        
-        row = item.row()
-        col = item.column()
-        
-        entry = self.viewmodel.get_entry_by_index(row)
+        entry = self.entries_model.entry_at(row)
         if not entry:
             return
         
         entry_id = int(entry["id"])
-        new_value = item.text().strip()
         
         try:
             # Column 0: Profile
             if col == 0:
-                project_name = str(entry.get("project_name", "—"))
+                project_name = str(entry["project_name"] or "—")
                 self.viewmodel.update_entry_profile_project(entry_id, new_value, project_name)
             
             # Column 1: Project
             elif col == 1:
-                profile_name = str(entry.get("profile_name", ""))
+                profile_name = str(entry["profile_name"])
                 self.viewmodel.update_entry_profile_project(entry_id, profile_name, new_value)
             
             # Column 2: Start timestamp
@@ -245,10 +261,10 @@ class TimerView(QWidget):
                 if new_start_ts is None:
                     QMessageBox.warning(self, "Invalid Format", 
                                       "Please use format: YYYY-MM-DD HH:MM:SS")
-                    self.viewmodel._refresh_entries()  # Restore original value
+                    self.viewmodel._schedule_refresh()  # Restore original value
                     return
                 
-                end_ts = int(entry["end_ts"]) if entry.get("end_ts") is not None else None
+                end_ts = int(entry["end_ts"]) if entry["end_ts"] is not None else None
                 self.viewmodel.update_entry_timestamps(entry_id, new_start_ts, end_ts)
             
             # Column 3: End timestamp
@@ -257,24 +273,24 @@ class TimerView(QWidget):
                 if new_end_ts is None and new_value != "—":
                     QMessageBox.warning(self, "Invalid Format", 
                                       "Please use format: YYYY-MM-DD HH:MM:SS or '—' for active entries")
-                    self.viewmodel._refresh_entries()  # Restore original value
+                    self.viewmodel._schedule_refresh()  # Restore original value
                     return
                 
-                start_ts = int(entry["start_ts"]) if entry.get("start_ts") is not None else 0
+                start_ts = int(entry["start_ts"]) if entry["start_ts"] is not None else 0
                 self.viewmodel.update_entry_timestamps(entry_id, start_ts, new_end_ts)
             
             # Column 5: Note
             elif col == 5:
-                tags = entry.get("tags", "")
+                tags = entry["tags"]
                 self.viewmodel.update_entry_note_tags(entry_id, new_value, tags)
         
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update entry: {str(e)}")
-            self.viewmodel._refresh_entries()  # Restore original value
+            self.viewmodel._schedule_refresh()  # Restore original value
     
     def _on_delete_selected(self) -> None:
         """Handle deletion of selected entries."""
-        rows = sorted({idx.row() for idx in self.table.selectedIndexes()})
+        rows = sorted(idx.row() for idx in self.table.selectionModel().selectedRows())
         if not rows:
             return
         
@@ -287,24 +303,13 @@ class TimerView(QWidget):
         if reply != QMessageBox.Yes:
             return
         
-        # Get entry IDs
-        entry_ids = []
-        for row in rows:
-            entry = self.viewmodel.get_entry_by_index(row)
-            if entry:
-                entry_ids.append(int(entry["id"]))
-        
+        entry_ids = self.entries_proxy.entry_ids(rows)
         if entry_ids:
             self.viewmodel.delete_entries(entry_ids)
     
     def _show_context_menu(self, pos) -> None:
         """Show context menu for entries table."""
-        menu = QMenu(self)
-        del_act = menu.addAction("Delete Selected")
-        
-        act = menu.exec(self.table.viewport().mapToGlobal(pos))
-        if act == del_act:
-            self._on_delete_selected()
+        self._ctx_menu.exec(self.table.viewport().mapToGlobal(pos))
     
     # ViewModel update handlers
     
@@ -322,69 +327,31 @@ class TimerView(QWidget):
         Args:
             seconds: Elapsed seconds
         """
+        # State syncs can repeat the current second between ticks; skip those
+        if seconds == self._last_elapsed_seconds:
+            return
+        self._last_elapsed_seconds = seconds
         self.elapsed_label.setText(format_duration(seconds))
     
     def _update_progress(self, elapsed_seconds: int, target_seconds: int | None) -> None:
         """Update progress display.
         
         Args:
-            elapsed_seconds: Total elapsed seconds today
+            elapsed_seconds: Total elapsed seconds for the selected profile or project
             target_seconds: Target seconds or None
         """
         # If All profiles is selected, hide the elapsed time display
         if self.viewmodel.selected_profile_id is None:
             self.progress.set_values(0, None)
-            self.et_label.setText("—")
+            text = "—"
         else:
             self.progress.set_values(elapsed_seconds, target_seconds)
             right = format_duration(target_seconds) if target_seconds else "—"
-            self.et_label.setText(f"{format_duration(elapsed_seconds)} / {right}")
-    
-    def _update_entries_table(self, entries: list) -> None:
-        """Update entries table with new data.
-        
-        Args:
-            entries: List of entry dicts
-        """
-        print(f"DEBUG: _update_entries_table called with {len(entries)} entries")
-        self.table.blockSignals(True)
-        self.table.setRowCount(0)
-        now = int(time.time())
-        
-        for entry in entries:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            start_ts = int(entry["start_ts"]) if entry.get("start_ts") is not None else None
-            end_ts = int(entry["end_ts"]) if entry.get("end_ts") is not None else None
-            dur = (end_ts or now) - (start_ts or now) if start_ts else 0
-            
-            # Profile (editable)
-            item0 = QTableWidgetItem(str(entry.get("profile_name", "")))
-            self.table.setItem(row, 0, item0)
-            
-            # Project (editable)
-            item1 = QTableWidgetItem(str(entry.get("project_name", "—")))
-            self.table.setItem(row, 1, item1)
-            
-            # Start (editable)
-            item2 = QTableWidgetItem(format_timestamp(start_ts or 0))
-            self.table.setItem(row, 2, item2)
-            
-            # End (editable)
-            item3 = QTableWidgetItem(format_timestamp(end_ts) if end_ts else "—")
-            self.table.setItem(row, 3, item3)
-            
-            # Duration (not editable - calculated field)
-            item4 = QTableWidgetItem(format_duration(dur))
-            item4.setFlags(item4.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 4, item4)
-            
-            # Note (editable)
-            item5 = QTableWidgetItem(str(entry.get("note", "")))
-            self.table.setItem(row, 5, item5)
-        
-        self.table.blockSignals(False)
+            text = f"{format_duration(elapsed_seconds)} / {right}"
+        # Skip the label relayout when the text did not change
+        if text != self._last_et_text:
+            self._last_et_text = text
+            self.et_label.setText(text)
     
     def _update_profiles_combo(self, profiles: list) -> None:
         """Update profiles combo box with new data.
@@ -414,7 +381,7 @@ class TimerView(QWidget):
         for proj in projects:
             self.project_combo.addItem(str(proj["name"]), int(proj["id"]))
         
-        # Reset to "All projects" (index 0)
-        self.project_combo.setCurrentIndex(0)
+        # Keep the ViewModel's selection ("All projects" if there is none)
+        self.project_combo.setCurrentIndex(max(0, self.project_combo.findData(self.viewmodel.selected_project_id)))
         self.project_combo.blockSignals(False)
 
@@ -1,6 +1,7 @@
 """Mehrwertsteuer (VAT) Calculator view."""
 from __future__ import annotations
 
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt
@@ -409,14 +410,12 @@ class VatCalculatorView(QWidget):
         """Handle 19% rate selection."""
         self.rate_19_btn.setChecked(True)
         self.rate_7_btn.setChecked(False)
-        from decimal import Decimal
         self.viewmodel.vat_rate = Decimal("19")
 
     def _on_rate_7_selected(self) -> None:
         """Handle 7% rate selection."""
         self.rate_7_btn.setChecked(True)
         self.rate_19_btn.setChecked(False)
-        from decimal import Decimal
         self.viewmodel.vat_rate = Decimal("7")
 
     def _on_netto_edited(self) -> None:
@@ -462,8 +461,13 @@ class VatCalculatorView(QWidget):
         """
         self._updating = True
         try:
-            self.netto_input.setText(netto)
-            self.mwst_input.setText(mwst)
-            self.brutto_input.setText(brutto)
+            # Fields that already show the value keep their cursor and undo history
+            for field, text in (
+                (self.netto_input, netto),
+                (self.mwst_input, mwst),
+                (self.brutto_input, brutto),
+            ):
+                if field.text() != text:
+                    field.setText(text)
         finally:
             self._updating = False
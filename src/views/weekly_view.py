@@ -78,44 +78,47 @@ class WeeklyView(QWidget):
         """Update weeks table with new data.
         
         Args:
-            weeks: List of week summary dicts
+            weeks: List of week summary rows
         """
-        self.table.setRowCount(0)
-        
-        for week_data in weeks:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            year = str(week_data.get("year", ""))
-            week_number = str(week_data.get("week_number", ""))
-            week_start_ts = int(week_data.get("week_start_ts", 0))
-            week_end_ts = int(week_data.get("week_end_ts", 0))
-            total_seconds = int(week_data.get("total_seconds", 0))
-            
-            # Calculate actual week start (Monday) and end (Sunday) from the week number
-            # SQLite's %W uses Monday as the first day of week
-            week_start_date = self._get_week_start_date(int(year), int(week_number))
-            week_end_date = week_start_date + timedelta(days=6)
-            
-            # Week column (e.g., "CW 45" for calendar week 45)
-            week_item = QTableWidgetItem(f"CW {week_number}")
-            week_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, week_item)
-            
-            # Start date column
-            start_item = QTableWidgetItem(week_start_date.strftime("%Y-%m-%d"))
-            start_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 1, start_item)
-            
-            # End date column
-            end_item = QTableWidgetItem(week_end_date.strftime("%Y-%m-%d"))
-            end_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 2, end_item)
+        # Size the table once and fill cells in place instead of inserting row by row
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(0)
+            self.table.setRowCount(len(weeks))
             
-            # Total time column
-            time_item = QTableWidgetItem(format_duration(total_seconds))
-            time_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 3, time_item)
+            for row, week_data in enumerate(weeks):
+                year = str(week_data["year"])
+                week_number = str(week_data["week_number"])
+                week_start_ts = int(week_data["week_start_ts"])
+                week_end_ts = int(week_data["week_end_ts"])
+                total_seconds = int(week_data["total_seconds"])
+                
+                # Calculate actual week start (Monday) and end (Sunday) from the week number
+                # SQLite's %W uses Monday as the first day of week
+                week_start_date = self._get_week_start_date(int(year), int(week_number))
+                week_end_date = week_start_date + timedelta(days=6)
+                
+                # Week column (e.g., "CW 45" for calendar week 45)
+                week_item = QTableWidgetItem(f"CW {week_number}")
+                week_item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row, 0, week_item)
+                
+                # Start date column
+                start_item = QTableWidgetItem(week_start_date.strftime("%Y-%m-%d"))
+                start_item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row, 1, start_item)
+                
+                # End date column
+                end_item = QTableWidgetItem(week_end_date.strftime("%Y-%m-%d"))
+                end_item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row, 2, end_item)
+                
+                # Total time column
+                time_item = QTableWidgetItem(format_duration(total_seconds))
+                time_item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row, 3, time_item)
+        finally:
+            self.table.setUpdatesEnabled(True)
     
     def _get_week_start_date(self, year: int, week_number: int) -> datetime:
         """Get the Monday of a given week number.